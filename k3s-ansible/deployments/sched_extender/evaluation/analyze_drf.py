@@ -9,142 +9,346 @@ the default scheduler and the scheduler with the extender.
 
 import json
 import os
+import re
 import subprocess
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless backend; skips GUI toolkit init
+matplotlib.rcParams['font.family'] = 'DejaVu Sans'  # skip font-matching scan
 import matplotlib.pyplot as plt
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# The kubernetes client + ijson give us a streaming path that avoids
+# materializing full multi-MB list responses; fall back to kubectl if
+# either is not installed.
+try:
+    import ijson
+    from kubernetes import client as k8s_client, config as k8s_config
+    HAS_K8S_CLIENT = True
+except ImportError:
+    HAS_K8S_CLIENT = False
+
+# orjson serializes in C; stdlib json remains the fallback.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Numba fuses the DRF share reductions into one native sweep; the
+# vectorized NumPy path remains the fallback.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 # Create results directory if it doesn't exist
 os.makedirs('results/drf_analysis', exist_ok=True)
 
+# The evaluation test cases and plot constants are fixed for a run, so
+# build them once at module scope instead of per plotting call.
+TEST_CASES = ("1", "2", "3")
+TEST_CASE_LABELS = tuple(f"Test {tc}" for tc in TEST_CASES)
+
+_DRF_METRIC_KEYS = ('avg_dominant_share', 'min_dominant_share',
+                    'max_dominant_share', 'stddev_dominant_share')
+_DRF_METRIC_LABELS = tuple(k.replace('_', ' ').title() for k in _DRF_METRIC_KEYS)
+_DRF_X = np.arange(len(_DRF_METRIC_KEYS))
+
+# Quantity strings are parsed with one compiled regex plus multiplier
+# lookups rather than a chain of endswith checks per value.
+_QTY_RE = re.compile(r'^(\d+(?:\.\d+)?)([a-zA-Z]+)?$')
+
+# CPU multipliers to millicores
+_CPU_MULT = {'': 1000, 'm': 1}
+
+# Memory multipliers to Mi (no suffix means bytes)
+_MEM_MULT = {
+    'Ki': 1 / 1024,
+    'Mi': 1,
+    'Gi': 1024,
+    'Ti': 1024 * 1024,
+    '': 1 / (1024 * 1024),
+}
+
+# Bit-shift amounts to Mi for the integer fast path (negative = right shift)
+_MEM_SHIFT = {
+    'Ki': -10,
+    'Mi': 0,
+    'Gi': 10,
+    'Ti': 20,
+    '': -20,
+}
+
+def parse_cpu(quantity):
+    """Parse a CPU quantity string into millicores"""
+    match = _QTY_RE.match(quantity)
+    if not match:
+        return 0
+    value, suffix = match.groups()
+    return int(float(value) * _CPU_MULT.get(suffix or '', 1))
+
+def parse_memory(quantity):
+    """Parse a memory quantity string into Mi"""
+    match = _QTY_RE.match(quantity)
+    if not match:
+        return 0
+    value, suffix = match.groups()
+    suffix = suffix or ''
+    # Kubernetes memory quantities are normally integral, so stay in
+    # integer space and shift instead of multiplying through float.
+    if '.' not in value:
+        shift = _MEM_SHIFT.get(suffix)
+        if shift is not None:
+            ivalue = int(value)
+            return ivalue << shift if shift >= 0 else ivalue >> -shift
+    return float(value) * _MEM_MULT.get(suffix, 1)
+
+_core_api = None
+
+def get_core_api():
+    """Return a lazily-created CoreV1Api client"""
+    global _core_api
+    if _core_api is None:
+        try:
+            k8s_config.load_kube_config()  # for local testing
+        except Exception:
+            k8s_config.load_incluster_config()  # when running inside cluster
+        # One shared client means one TLS session reused across every
+        # list call in the run; size the pool for the concurrent fetches
+        # in compare_drf_for_test_case.
+        configuration = k8s_client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = 4
+        _core_api = k8s_client.CoreV1Api(k8s_client.ApiClient(configuration))
+    return _core_api
+
+def write_json(path, obj):
+    """Write obj to path as indented JSON in a single buffered write"""
+    if HAS_ORJSON:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
 def run_command(cmd):
-    """Run a shell command and return its output"""
-    process = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    stdout, stderr = process.communicate()
-    if process.returncode != 0:
-        print(f"Error executing command: {cmd}")
-        print(stderr.decode())
+    """Run a command given as an argv list and return its stdout"""
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        print(f"Error executing command: {' '.join(cmd)}")
+        print(result.stderr)
         return ""
-    return stdout.decode()
+    return result.stdout
+
+def iter_node_capacities():
+    """Yield (name, cpu_str, memory_str) for every node.
+
+    Streams the node list through ijson so only the fields we keep are
+    ever materialized, instead of json.loads-ing the whole response.
+    """
+    if HAS_K8S_CLIENT:
+        resp = get_core_api().list_node(_preload_content=False)
+        try:
+            name = cpu = memory = None
+            for prefix, event, value in ijson.parse(resp):
+                if prefix == 'items.item.metadata.name':
+                    name = value
+                elif prefix == 'items.item.status.capacity.cpu':
+                    cpu = value
+                elif prefix == 'items.item.status.capacity.memory':
+                    memory = value
+                elif prefix == 'items.item' and event == 'end_map':
+                    yield name, cpu or '0', memory or '0'
+                    name = cpu = memory = None
+        finally:
+            resp.release_conn()
+    else:
+        output = run_command(["kubectl", "get", "nodes", "-o", "json"])
+        if output:
+            for node in json.loads(output).get('items', []):
+                yield (node['metadata']['name'],
+                       node['status']['capacity'].get('cpu', '0'),
+                       node['status']['capacity'].get('memory', '0'))
+
+def iter_pod_requests(namespace):
+    """Yield (node_name, [(cpu_str, mem_str), ...]) for every running pod in a namespace.
+
+    Same streaming approach as iter_node_capacities: only nodeName and
+    per-container resource requests are kept from the pod list. The
+    Running filter is pushed server-side with a field selector, which
+    shrinks the response dramatically in namespaces full of
+    Completed/Failed pods.
+    """
+    if HAS_K8S_CLIENT:
+        resp = get_core_api().list_namespaced_pod(
+            namespace, field_selector='status.phase=Running', _preload_content=False)
+        try:
+            node_name = None
+            containers = []
+            cpu = mem = None
+            for prefix, event, value in ijson.parse(resp):
+                if prefix == 'items.item.spec.nodeName':
+                    node_name = value
+                elif prefix == 'items.item.spec.containers.item.resources.requests.cpu':
+                    cpu = value
+                elif prefix == 'items.item.spec.containers.item.resources.requests.memory':
+                    mem = value
+                elif prefix == 'items.item.spec.containers.item' and event == 'end_map':
+                    containers.append((cpu or '0', mem or '0'))
+                    cpu = mem = None
+                elif prefix == 'items.item' and event == 'end_map':
+                    yield node_name, containers
+                    node_name = None
+                    containers = []
+        finally:
+            resp.release_conn()
+    else:
+        output = run_command(["kubectl", "get", "pods", "-n", namespace,
+                              "--field-selector=status.phase=Running",
+                              "--chunk-size=500", "-o", "json"])
+        if output:
+            for pod in json.loads(output).get('items', []):
+                containers = [
+                    (container.get('resources', {}).get('requests', {}).get('cpu', '0'),
+                     container.get('resources', {}).get('requests', {}).get('memory', '0'))
+                    for container in pod.get('spec', {}).get('containers', [])
+                ]
+                yield pod.get('spec', {}).get('nodeName'), containers
 
+@lru_cache(maxsize=1)
 def get_node_capacities():
-    """Get the resource capacities of all nodes"""
-    output = run_command("kubectl get nodes -o json")
-    if not output:
-        return {}
-    
-    nodes_data = json.loads(output)
+    """Get the resource capacities of all nodes.
+
+    Node capacity is invariant for the duration of a run, so the result
+    is memoized and the API is only hit once across all test cases.
+    """
     node_capacities = {}
-    
-    for node in nodes_data.get('items', []):
-        name = node['metadata']['name']
-        cpu_capacity = node['status']['capacity'].get('cpu', '0')
-        memory_capacity = node['status']['capacity'].get('memory', '0')
-        
-        # Convert CPU to millicores if needed
-        if not cpu_capacity.endswith('m'):
-            cpu_capacity = int(float(cpu_capacity) * 1000)
-        else:
-            cpu_capacity = int(cpu_capacity[:-1])
-            
-        # Convert memory to Mi
-        if memory_capacity.endswith('Ki'):
-            memory_capacity = int(memory_capacity[:-2]) / 1024
-        elif memory_capacity.endswith('Mi'):
-            memory_capacity = int(memory_capacity[:-2])
-        elif memory_capacity.endswith('Gi'):
-            memory_capacity = int(memory_capacity[:-2]) * 1024
-        else:
-            # Assume bytes
-            memory_capacity = int(memory_capacity) / (1024 * 1024)
-            
+
+    for name, cpu_capacity, memory_capacity in iter_node_capacities():
         node_capacities[name] = {
-            'cpu': cpu_capacity,
-            'memory': memory_capacity
+            'cpu': parse_cpu(cpu_capacity),
+            'memory': parse_memory(memory_capacity)
         }
-    
+
     return node_capacities
 
 def get_pod_placements(namespace):
     """Get pod placements and their resource allocations for a namespace"""
-    output = run_command(f"kubectl get pods -n {namespace} -o json")
-    if not output:
-        return {}
-    
-    pods_data = json.loads(output)
-    pod_placements = defaultdict(lambda: {'cpu': 0, 'memory': 0, 'pods': 0})
-    
-    for pod in pods_data.get('items', []):
-        node_name = pod.get('spec', {}).get('nodeName')
-        if not node_name or pod.get('status', {}).get('phase') != 'Running':
+    # Map node names to dense integer indices on first sight, collect one
+    # flat (index, cpu, memory) row per running pod, and reduce per node
+    # with bincount — the SoA layout feeds straight into the metrics
+    # kernel with no string hashing in the accumulation.
+    node_index = {}
+    node_names = []
+    indices = []
+    cpus = []
+    mems = []
+
+    for node_name, containers in iter_pod_requests(namespace):
+        if not node_name:
             continue
-            
-        containers = pod.get('spec', {}).get('containers', [])
-        for container in containers:
-            requests = container.get('resources', {}).get('requests', {})
-            
-            # Get CPU request
-            cpu_request = requests.get('cpu', '0')
-            if not cpu_request.endswith('m'):
-                cpu_millicores = int(float(cpu_request) * 1000)
-            else:
-                cpu_millicores = int(cpu_request[:-1])
-                
-            # Get memory request
-            memory_request = requests.get('memory', '0')
-            if memory_request.endswith('Ki'):
-                memory_mi = int(memory_request[:-2]) / 1024
-            elif memory_request.endswith('Mi'):
-                memory_mi = int(memory_request[:-2])
-            elif memory_request.endswith('Gi'):
-                memory_mi = int(memory_request[:-2]) * 1024
-            else:
-                # Assume bytes
-                memory_mi = int(memory_request) / (1024 * 1024)
-                
-            pod_placements[node_name]['cpu'] += cpu_millicores
-            pod_placements[node_name]['memory'] += memory_mi
-            
-        # Count this pod
-        pod_placements[node_name]['pods'] += 1
-    
-    return pod_placements
+
+        idx = node_index.get(node_name)
+        if idx is None:
+            idx = node_index[node_name] = len(node_index)
+            node_names.append(node_name)
+
+        indices.append(idx)
+        cpus.append(sum(parse_cpu(cpu) for cpu, _ in containers))
+        mems.append(sum(parse_memory(mem) for _, mem in containers))
+
+    if not node_names:
+        return {}
+
+    indices = np.asarray(indices)
+    num_nodes = len(node_names)
+    cpu_per_node = np.bincount(indices, weights=np.asarray(cpus, dtype=np.float64), minlength=num_nodes)
+    mem_per_node = np.bincount(indices, weights=np.asarray(mems, dtype=np.float64), minlength=num_nodes)
+    pods_per_node = np.bincount(indices, minlength=num_nodes)
+
+    return {
+        name: {'cpu': cpu_per_node[i], 'memory': mem_per_node[i], 'pods': int(pods_per_node[i])}
+        for i, name in enumerate(node_names)
+    }
+
+def _drf_kernel(cpu_shares, memory_shares):
+    """Reduce per-node shares to DRF metrics in a single sweep.
+
+    Computes mean/min/max of the dominant share, its stddev via
+    Welford's online algorithm, and the cpu/memory share means in one
+    pass; compiled with numba when available.
+    """
+    n = cpu_shares.shape[0]
+    dominant = np.empty(n)
+    mean = 0.0
+    m2 = 0.0
+    dom_min = np.inf
+    dom_max = -np.inf
+    cpu_sum = 0.0
+    mem_sum = 0.0
+    for i in range(n):
+        cpu = cpu_shares[i]
+        mem = memory_shares[i]
+        dom = cpu if cpu > mem else mem
+        dominant[i] = dom
+        cpu_sum += cpu
+        mem_sum += mem
+        if dom < dom_min:
+            dom_min = dom
+        if dom > dom_max:
+            dom_max = dom
+        delta = dom - mean
+        mean += delta / (i + 1)
+        m2 += delta * (dom - mean)
+    stddev = (m2 / n) ** 0.5
+    return mean, dom_min, dom_max, stddev, cpu_sum / n, mem_sum / n, dominant
+
+if HAS_NUMBA:
+    _drf_kernel = numba.njit(cache=True, fastmath=True)(_drf_kernel)
 
 def calculate_drf_metrics(node_capacities, pod_placements):
     """Calculate DRF metrics for the given pod placements"""
-    dominant_shares = []
-    cpu_shares = []
-    memory_shares = []
-    
-    for node_name, resources in pod_placements.items():
-        if node_name not in node_capacities:
-            continue
-            
-        node_capacity = node_capacities[node_name]
-        
-        # Calculate resource shares
-        cpu_share = resources['cpu'] / node_capacity['cpu']
-        memory_share = resources['memory'] / node_capacity['memory']
-        
-        # The dominant share is the maximum of the resource shares
-        dominant_share = max(cpu_share, memory_share)
-        
-        dominant_shares.append(dominant_share)
-        cpu_shares.append(cpu_share)
-        memory_shares.append(memory_share)
-    
-    # Calculate standard metrics
-    if dominant_shares:
+    common_nodes = [node for node in pod_placements if node in node_capacities]
+
+    # Build aligned (N, 2) usage/capacity arrays so all shares come out of
+    # a single vectorized division instead of per-node Python arithmetic.
+    usage = np.array([[pod_placements[node]['cpu'], pod_placements[node]['memory']]
+                      for node in common_nodes], dtype=np.float64)
+    capacity = np.array([[node_capacities[node]['cpu'], node_capacities[node]['memory']]
+                         for node in common_nodes], dtype=np.float64)
+
+    if common_nodes:
+        shares = usage / capacity
+        cpu_shares = np.ascontiguousarray(shares[:, 0])
+        memory_shares = np.ascontiguousarray(shares[:, 1])
+
+        if HAS_NUMBA:
+            (avg_dom, min_dom, max_dom, stddev_dom,
+             avg_cpu_share, avg_memory_share, dominant_shares) = _drf_kernel(cpu_shares, memory_shares)
+        else:
+            # The dominant share is the maximum of the resource shares
+            dominant_shares = shares.max(axis=1)
+            avg_cpu_share, avg_memory_share = shares.mean(axis=0)
+            avg_dom = dominant_shares.mean()
+            min_dom = dominant_shares.min()
+            max_dom = dominant_shares.max()
+            stddev_dom = dominant_shares.std()
+
         fairness_metrics = {
-            'avg_dominant_share': np.mean(dominant_shares),
-            'min_dominant_share': np.min(dominant_shares),
-            'max_dominant_share': np.max(dominant_shares),
-            'stddev_dominant_share': np.std(dominant_shares),
-            'avg_cpu_share': np.mean(cpu_shares),
-            'avg_memory_share': np.mean(memory_shares),
-            'cpu_memory_ratio': np.mean(cpu_shares) / np.mean(memory_shares) if np.mean(memory_shares) > 0 else 0
+            'avg_dominant_share': avg_dom,
+            'min_dominant_share': min_dom,
+            'max_dominant_share': max_dom,
+            'stddev_dominant_share': stddev_dom,
+            'avg_cpu_share': avg_cpu_share,
+            'avg_memory_share': avg_memory_share,
+            'cpu_memory_ratio': avg_cpu_share / avg_memory_share if avg_memory_share > 0 else 0
         }
     else:
+        dominant_shares = np.empty(0)
+        cpu_shares = np.empty(0)
+        memory_shares = np.empty(0)
         fairness_metrics = {
             'avg_dominant_share': 0,
             'min_dominant_share': 0,
@@ -157,139 +361,178 @@ def calculate_drf_metrics(node_capacities, pod_placements):
     
     return fairness_metrics, dominant_shares, cpu_shares, memory_shares
 
-def compare_drf_for_test_case(test_case):
-    """Compare DRF metrics between default and scheduler with extender for a test case"""
-    node_capacities = get_node_capacities()
-    
+def compare_drf_for_test_case(test_case, fig_hist, fig_bar, fig_scatter):
+    """Compare DRF metrics between default and scheduler with extender for a test case
+
+    The three figures are preallocated by the caller and reused across
+    test cases (cleared between uses) so each run allocates a fixed
+    number of canvases regardless of how many test cases it covers.
+    """
     default_ns = f"sched-test{'-' + test_case if test_case else ''}"
     extender_ns = f"sched-test{'-' + test_case if test_case else ''}-extender"
-    
-    # Get pod placements
-    default_placements = get_pod_placements(default_ns)
-    extender_placements = get_pod_placements(extender_ns)
+
+    # The three list calls are independent network I/O, so fetch them
+    # concurrently; plotting stays on the main thread since matplotlib
+    # is not thread-safe.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        capacities_future = executor.submit(get_node_capacities)
+        default_future = executor.submit(get_pod_placements, default_ns)
+        extender_future = executor.submit(get_pod_placements, extender_ns)
+
+        node_capacities = capacities_future.result()
+        default_placements = default_future.result()
+        extender_placements = extender_future.result()
     
     # Calculate DRF metrics
     default_metrics, default_dom_shares, default_cpu, default_mem = calculate_drf_metrics(node_capacities, default_placements)
     extender_metrics, extender_dom_shares, extender_cpu, extender_mem = calculate_drf_metrics(node_capacities, extender_placements)
-    
+
+    # Nothing running in either namespace (e.g. a partial run): skip the
+    # metrics file and the three plots rather than emitting empty output.
+    if not default_placements and not extender_placements:
+        print(f"No running pods found for test case {test_case}; skipping plots")
+        return default_metrics, extender_metrics
+
     # Save metrics to file
-    with open(f'results/drf_analysis/test-case-{test_case}-metrics.json', 'w') as f:
-        json.dump({
-            'default_scheduler': default_metrics,
-            'scheduler_with_extender': extender_metrics
-        }, f, indent=2)
+    write_json(f'results/drf_analysis/test-case-{test_case}-metrics.json', {
+        'default_scheduler': default_metrics,
+        'scheduler_with_extender': extender_metrics
+    })
     
     # Create visualizations
-    
+
     # 1. Dominant Share Distribution
-    plt.figure(figsize=(12, 6))
-    if default_dom_shares:
-        plt.subplot(1, 2, 1)
-        plt.hist(default_dom_shares, bins=10, alpha=0.7, label='Default Scheduler')
-        plt.xlabel('Dominant Share')
-        plt.ylabel('Number of Nodes')
-        plt.title('Default Scheduler: Dominant Share Distribution')
-        plt.grid(True, linestyle='--', alpha=0.7)
-    
-    if extender_dom_shares:
-        plt.subplot(1, 2, 2)
-        plt.hist(extender_dom_shares, bins=10, alpha=0.7, label='Scheduler with Extender', color='green')
-        plt.xlabel('Dominant Share')
-        plt.ylabel('Number of Nodes')
-        plt.title('Scheduler with Extender: Dominant Share Distribution')
-        plt.grid(True, linestyle='--', alpha=0.7)
-    
-    plt.tight_layout()
-    plt.savefig(f'results/drf_analysis/test-case-{test_case}-dominant-share-dist.png')
-    
+    fig_hist.clear()
+    hist_axes = fig_hist.subplots(1, 2)
+    if default_dom_shares.size:
+        ax = hist_axes[0]
+        ax.hist(default_dom_shares, bins=10, alpha=0.7, label='Default Scheduler')
+        ax.set_xlabel('Dominant Share')
+        ax.set_ylabel('Number of Nodes')
+        ax.set_title('Default Scheduler: Dominant Share Distribution')
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+    if extender_dom_shares.size:
+        ax = hist_axes[1]
+        ax.hist(extender_dom_shares, bins=10, alpha=0.7, label='Scheduler with Extender', color='green')
+        ax.set_xlabel('Dominant Share')
+        ax.set_ylabel('Number of Nodes')
+        ax.set_title('Scheduler with Extender: Dominant Share Distribution')
+        ax.grid(True, linestyle='--', alpha=0.7)
+
+    fig_hist.savefig(f'results/drf_analysis/test-case-{test_case}-dominant-share-dist.png')
+
     # 2. Resource Share Comparison
-    plt.figure(figsize=(12, 6))
-    
+    fig_bar.clear()
+    ax = fig_bar.subplots()
+
     # Data prep for bar chart
-    metrics = ['avg_dominant_share', 'min_dominant_share', 'max_dominant_share', 'stddev_dominant_share']
-    default_values = [default_metrics[m] for m in metrics]
-    extender_values = [extender_metrics[m] for m in metrics]
-    
-    x = np.arange(len(metrics))
+    default_values = [default_metrics[m] for m in _DRF_METRIC_KEYS]
+    extender_values = [extender_metrics[m] for m in _DRF_METRIC_KEYS]
+
     width = 0.35
-    
-    plt.bar(x - width/2, default_values, width, label='Default Scheduler')
-    plt.bar(x + width/2, extender_values, width, label='Scheduler with Extender', color='green')
-    
-    plt.xlabel('Metrics')
-    plt.ylabel('Value')
-    plt.title(f'Dominant Resource Fairness Metrics - Test Case {test_case}')
-    plt.xticks(x, [m.replace('_', ' ').title() for m in metrics])
-    plt.legend()
-    plt.grid(True, linestyle='--', alpha=0.7)
-    
-    plt.tight_layout()
-    plt.savefig(f'results/drf_analysis/test-case-{test_case}-drf-metrics.png')
-    
+
+    ax.bar(_DRF_X - width/2, default_values, width, label='Default Scheduler')
+    ax.bar(_DRF_X + width/2, extender_values, width, label='Scheduler with Extender', color='green')
+
+    ax.set_xlabel('Metrics')
+    ax.set_ylabel('Value')
+    ax.set_title(f'Dominant Resource Fairness Metrics - Test Case {test_case}')
+    ax.set_xticks(_DRF_X)
+    ax.set_xticklabels(_DRF_METRIC_LABELS)
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.7)
+
+    fig_bar.savefig(f'results/drf_analysis/test-case-{test_case}-drf-metrics.png')
+
     # 3. CPU vs Memory Share
-    plt.figure(figsize=(10, 8))
-    
-    if default_cpu and default_mem:
-        plt.subplot(2, 1, 1)
-        plt.scatter(default_cpu, default_mem, alpha=0.7, label='Default Scheduler')
-        plt.xlabel('CPU Share')
-        plt.ylabel('Memory Share')
-        plt.title('Default Scheduler: CPU vs Memory Share')
+    fig_scatter.clear()
+    scatter_axes = fig_scatter.subplots(2, 1)
+
+    if default_cpu.size and default_mem.size:
+        ax = scatter_axes[0]
+        ax.scatter(default_cpu, default_mem, alpha=0.7, label='Default Scheduler')
+        ax.set_xlabel('CPU Share')
+        ax.set_ylabel('Memory Share')
+        ax.set_title('Default Scheduler: CPU vs Memory Share')
         # Add the perfect balance line
-        max_share = max(max(default_cpu) if default_cpu else 0, max(default_mem) if default_mem else 0)
-        plt.plot([0, max_share], [0, max_share], 'k--', alpha=0.5)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.legend()
-    
-    if extender_cpu and extender_mem:
-        plt.subplot(2, 1, 2)
-        plt.scatter(extender_cpu, extender_mem, alpha=0.7, label='Scheduler with Extender', color='green')
-        plt.xlabel('CPU Share')
-        plt.ylabel('Memory Share')
-        plt.title('Scheduler with Extender: CPU vs Memory Share')
+        max_share = max(default_cpu.max(), default_mem.max())
+        ax.plot([0, max_share], [0, max_share], 'k--', alpha=0.5)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.legend()
+
+    if extender_cpu.size and extender_mem.size:
+        ax = scatter_axes[1]
+        ax.scatter(extender_cpu, extender_mem, alpha=0.7, label='Scheduler with Extender', color='green')
+        ax.set_xlabel('CPU Share')
+        ax.set_ylabel('Memory Share')
+        ax.set_title('Scheduler with Extender: CPU vs Memory Share')
         # Add the perfect balance line
-        max_share = max(max(extender_cpu) if extender_cpu else 0, max(extender_mem) if extender_mem else 0)
-        plt.plot([0, max_share], [0, max_share], 'k--', alpha=0.5)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.legend()
-    
-    plt.tight_layout()
-    plt.savefig(f'results/drf_analysis/test-case-{test_case}-cpu-vs-memory.png')
-    
+        max_share = max(extender_cpu.max(), extender_mem.max())
+        ax.plot([0, max_share], [0, max_share], 'k--', alpha=0.5)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.legend()
+
+    fig_scatter.savefig(f'results/drf_analysis/test-case-{test_case}-cpu-vs-memory.png')
+
     return default_metrics, extender_metrics
 
 def main():
     """Main function to run the DRF analysis"""
     print("Analyzing Dominant Resource Fairness for test cases...")
     
-    test_cases = ["1", "2", "3"]
+    test_cases = TEST_CASES
     comparison_data = {}
-    
+
+    # Preallocate one figure per plot shape and reuse them for every
+    # test case instead of leaking a fresh Figure per plot.
+    # Fixed subplot margins instead of running the tight_layout solver
+    # after every draw.
+    plt.rcParams['figure.autolayout'] = False
+    fig_hist = plt.figure(figsize=(12, 6))
+    fig_hist.subplots_adjust(left=0.08, right=0.97, top=0.93, bottom=0.1, wspace=0.25)
+    fig_bar = plt.figure(figsize=(12, 6))
+    fig_bar.subplots_adjust(left=0.08, right=0.97, top=0.93, bottom=0.1)
+    fig_scatter = plt.figure(figsize=(10, 8))
+    fig_scatter.subplots_adjust(left=0.08, right=0.97, top=0.93, bottom=0.1, hspace=0.3)
+
     for test_case in test_cases:
         print(f"Analyzing test case {test_case}...")
-        default_metrics, extender_metrics = compare_drf_for_test_case(test_case)
+        default_metrics, extender_metrics = compare_drf_for_test_case(
+            test_case, fig_hist, fig_bar, fig_scatter)
         comparison_data[test_case] = {
             'default_scheduler': default_metrics,
             'scheduler_with_extender': extender_metrics
         }
     
     # Save overall comparison
-    with open('results/drf_analysis/overall-comparison.json', 'w') as f:
-        json.dump(comparison_data, f, indent=2)
+    write_json('results/drf_analysis/overall-comparison.json', comparison_data)
     
-    # Create summary visualization
-    plt.figure(figsize=(12, 8))
-    
-    test_case_labels = [f"Test {tc}" for tc in test_cases]
-    default_avg_dom_shares = [comparison_data[tc]['default_scheduler']['avg_dominant_share'] for tc in test_cases]
-    extender_avg_dom_shares = [comparison_data[tc]['scheduler_with_extender']['avg_dominant_share'] for tc in test_cases]
-    default_stddev_dom_shares = [comparison_data[tc]['default_scheduler']['stddev_dominant_share'] for tc in test_cases]
-    extender_stddev_dom_shares = [comparison_data[tc]['scheduler_with_extender']['stddev_dominant_share'] for tc in test_cases]
+    # Create summary visualization, reusing the scatter-shaped figure
+    fig_summary = fig_scatter
+    fig_summary.clear()
+    fig_summary.set_size_inches(12, 8)
+    ax1, ax2 = fig_summary.subplots(2, 1)
+
+    test_case_labels = TEST_CASE_LABELS
+
+    # One (scheduler, test case, metric) array feeds both summary plots
+    # and the overall improvement numbers below, instead of a separate
+    # list comprehension per series.
+    summary_arr = np.array([
+        [[comparison_data[tc][sched][m]
+          for m in ('avg_dominant_share', 'stddev_dominant_share')]
+         for tc in test_cases]
+        for sched in ('default_scheduler', 'scheduler_with_extender')
+    ])
+    default_avg_dom_shares = summary_arr[0, :, 0]
+    extender_avg_dom_shares = summary_arr[1, :, 0]
+    default_stddev_dom_shares = summary_arr[0, :, 1]
+    extender_stddev_dom_shares = summary_arr[1, :, 1]
     
     x = np.arange(len(test_cases))
     width = 0.35
-    
-    ax1 = plt.subplot(2, 1, 1)
+
     ax1.bar(x - width/2, default_avg_dom_shares, width, label='Default Scheduler')
     ax1.bar(x + width/2, extender_avg_dom_shares, width, label='Scheduler with Extender', color='green')
     
@@ -301,7 +544,6 @@ def main():
     ax1.legend()
     ax1.grid(True, linestyle='--', alpha=0.7)
     
-    ax2 = plt.subplot(2, 1, 2)
     ax2.bar(x - width/2, default_stddev_dom_shares, width, label='Default Scheduler')
     ax2.bar(x + width/2, extender_stddev_dom_shares, width, label='Scheduler with Extender', color='green')
     
@@ -313,54 +555,58 @@ def main():
     ax2.legend()
     ax2.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
-    plt.savefig('results/drf_analysis/overall-comparison.png')
+    fig_summary.savefig('results/drf_analysis/overall-comparison.png')
     
-    # Write a summary report
+    # Build the summary report in memory and write it out in one go
+    lines = []
+    lines.append("Dominant Resource Fairness Analysis Summary\n")
+    lines.append("=========================================\n\n")
+
+    for tc in test_cases:
+        lines.append(f"Test Case {tc}:\n")
+        lines.append("-------------\n")
+
+        def_metrics = comparison_data[tc]['default_scheduler']
+        ext_metrics = comparison_data[tc]['scheduler_with_extender']
+        def_stddev = def_metrics['stddev_dominant_share']
+        ext_stddev = ext_metrics['stddev_dominant_share']
+
+        lines.append(f"Default Scheduler:\n")
+        lines.append(f"  - Average Dominant Share: {def_metrics['avg_dominant_share']:.4f}\n")
+        lines.append(f"  - Min/Max Dominant Share: {def_metrics['min_dominant_share']:.4f}/{def_metrics['max_dominant_share']:.4f}\n")
+        lines.append(f"  - Standard Deviation: {def_stddev:.4f}\n")
+        lines.append(f"  - CPU/Memory Ratio: {def_metrics['cpu_memory_ratio']:.4f}\n\n")
+
+        lines.append(f"Scheduler with Extender:\n")
+        lines.append(f"  - Average Dominant Share: {ext_metrics['avg_dominant_share']:.4f}\n")
+        lines.append(f"  - Min/Max Dominant Share: {ext_metrics['min_dominant_share']:.4f}/{ext_metrics['max_dominant_share']:.4f}\n")
+        lines.append(f"  - Standard Deviation: {ext_stddev:.4f}\n")
+        lines.append(f"  - CPU/Memory Ratio: {ext_metrics['cpu_memory_ratio']:.4f}\n\n")
+
+        stddev_improvement = (def_stddev - ext_stddev) / def_stddev * 100 if def_stddev > 0 else 0
+        lines.append(f"Fairness Improvement: {stddev_improvement:.2f}% (based on reduction in standard deviation)\n\n")
+
+    lines.append("\nOverall Conclusion:\n")
+    lines.append("------------------\n")
+
+    # Calculate overall improvement across all test cases
+    avg_stddev_default = default_stddev_dom_shares.mean()
+    avg_stddev_extender = extender_stddev_dom_shares.mean()
+    overall_improvement = (avg_stddev_default - avg_stddev_extender) / avg_stddev_default * 100 if avg_stddev_default > 0 else 0
+
+    lines.append(f"The scheduler with extender shows a {overall_improvement:.2f}% improvement in fairness ")
+    lines.append("based on the standard deviation of dominant shares across all test cases.\n\n")
+
+    if overall_improvement > 10:
+        lines.append("The scheduler extender demonstrates a SIGNIFICANT improvement in enforcing dominant resource fairness.")
+    elif overall_improvement > 0:
+        lines.append("The scheduler extender demonstrates a MODEST improvement in enforcing dominant resource fairness.")
+    else:
+        lines.append("The scheduler extender does NOT show an improvement in enforcing dominant resource fairness compared to the default scheduler.")
+
     with open('results/drf_analysis/summary.txt', 'w') as f:
-        f.write("Dominant Resource Fairness Analysis Summary\n")
-        f.write("=========================================\n\n")
-        
-        for tc in test_cases:
-            f.write(f"Test Case {tc}:\n")
-            f.write("-------------\n")
-            
-            def_metrics = comparison_data[tc]['default_scheduler']
-            ext_metrics = comparison_data[tc]['scheduler_with_extender']
-            
-            f.write(f"Default Scheduler:\n")
-            f.write(f"  - Average Dominant Share: {def_metrics['avg_dominant_share']:.4f}\n")
-            f.write(f"  - Min/Max Dominant Share: {def_metrics['min_dominant_share']:.4f}/{def_metrics['max_dominant_share']:.4f}\n")
-            f.write(f"  - Standard Deviation: {def_metrics['stddev_dominant_share']:.4f}\n")
-            f.write(f"  - CPU/Memory Ratio: {def_metrics['cpu_memory_ratio']:.4f}\n\n")
-            
-            f.write(f"Scheduler with Extender:\n")
-            f.write(f"  - Average Dominant Share: {ext_metrics['avg_dominant_share']:.4f}\n")
-            f.write(f"  - Min/Max Dominant Share: {ext_metrics['min_dominant_share']:.4f}/{ext_metrics['max_dominant_share']:.4f}\n")
-            f.write(f"  - Standard Deviation: {ext_metrics['stddev_dominant_share']:.4f}\n")
-            f.write(f"  - CPU/Memory Ratio: {ext_metrics['cpu_memory_ratio']:.4f}\n\n")
-            
-            stddev_improvement = (def_metrics['stddev_dominant_share'] - ext_metrics['stddev_dominant_share']) / def_metrics['stddev_dominant_share'] * 100 if def_metrics['stddev_dominant_share'] > 0 else 0
-            f.write(f"Fairness Improvement: {stddev_improvement:.2f}% (based on reduction in standard deviation)\n\n")
-        
-        f.write("\nOverall Conclusion:\n")
-        f.write("------------------\n")
-        
-        # Calculate overall improvement across all test cases
-        avg_stddev_default = np.mean([comparison_data[tc]['default_scheduler']['stddev_dominant_share'] for tc in test_cases])
-        avg_stddev_extender = np.mean([comparison_data[tc]['scheduler_with_extender']['stddev_dominant_share'] for tc in test_cases])
-        overall_improvement = (avg_stddev_default - avg_stddev_extender) / avg_stddev_default * 100 if avg_stddev_default > 0 else 0
-        
-        f.write(f"The scheduler with extender shows a {overall_improvement:.2f}% improvement in fairness ")
-        f.write("based on the standard deviation of dominant shares across all test cases.\n\n")
-        
-        if overall_improvement > 10:
-            f.write("The scheduler extender demonstrates a SIGNIFICANT improvement in enforcing dominant resource fairness.")
-        elif overall_improvement > 0:
-            f.write("The scheduler extender demonstrates a MODEST improvement in enforcing dominant resource fairness.")
-        else:
-            f.write("The scheduler extender does NOT show an improvement in enforcing dominant resource fairness compared to the default scheduler.")
-    
+        f.write(''.join(lines))
+
     print("Analysis complete! Results saved to the results/drf_analysis/ directory.")
 
 if __name__ == "__main__":
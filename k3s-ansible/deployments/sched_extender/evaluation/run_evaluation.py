@@ -4,51 +4,162 @@ Evaluation script for comparing the performance of the default Kubernetes schedu
 with the Kubernetes scheduler enhanced by the scheduler extender.
 """
 
+import asyncio
 import os
 import json
 import time
 import subprocess
+import matplotlib
+matplotlib.use("Agg")  # headless raster backend; select before pyplot import
 import matplotlib.pyplot as plt
 import numpy as np
-from datetime import datetime
+import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from kubernetes import client, config
+
+# ijson walks the pod list response as a token stream so only the few
+# fields we use are ever materialized.
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# orjson parses/serializes in C; stdlib json remains the fallback.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Numba compiles the DRF reduction to native code; NumPy is the fallback.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 # Create results directory
 RESULTS_DIR = "results"
 os.makedirs(RESULTS_DIR, exist_ok=True)
 
+# Plot jobs render on this single worker so the test runner never blocks
+# on matplotlib, and all drawing stays confined to one thread. Futures are
+# kept so plot failures surface when the executor is drained.
+_plot_executor = ThreadPoolExecutor(max_workers=1)
+_plot_futures = []
+
+def loads(data):
+    """Parse JSON bytes with orjson when available"""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+def write_json(path, obj):
+    """Write obj to path as indented JSON in a single buffered write"""
+    if HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
+
+# Binary memory suffixes to bytes; quantities without a suffix are raw bytes.
+_MEM_MULT = {"Ki": 1024.0, "Mi": 1024.0 ** 2, "Gi": 1024.0 ** 3, "Ti": 1024.0 ** 4}
+
+@lru_cache(maxsize=4096)
+def parse_cpu(quantity):
+    """Parse a Kubernetes CPU quantity (e.g. '500m', '2') into cores"""
+    if quantity.endswith("m"):
+        return float(quantity[:-1]) / 1000
+    return float(quantity)
+
+@lru_cache(maxsize=4096)
+def parse_memory(quantity):
+    """Parse a Kubernetes memory quantity (e.g. '8192Mi') into bytes"""
+    mult = _MEM_MULT.get(quantity[-2:])
+    if mult is None:
+        return float(quantity)
+    return float(quantity[:-2]) * mult
+
+@lru_cache(maxsize=None)
+def yaml_meta(path):
+    """Parse a test manifest once and return (namespace, expected pod count)"""
+    with open(path) as f:
+        docs = [doc for doc in yaml.safe_load_all(f) if doc]
+
+    namespace = "default"
+    expected_pods = 0
+    for doc in docs:
+        kind = doc.get("kind")
+        metadata = doc.get("metadata", {})
+        if kind == "Namespace":
+            namespace = metadata["name"]
+        elif kind == "Deployment":
+            expected_pods += doc.get("spec", {}).get("replicas", 1)
+            namespace = metadata.get("namespace", namespace)
+        elif kind == "Pod":
+            expected_pods += 1
+            namespace = metadata.get("namespace", namespace)
+    return namespace, expected_pods
+
+def append_jsonl(fh, obj):
+    """Append one JSON record to an open binary stream and flush it"""
+    if HAS_ORJSON:
+        fh.write(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        fh.write(json.dumps(obj).encode())
+    fh.write(b"\n")
+    fh.flush()
+
+_core_api = None
+
+def get_core_api():
+    """Return a lazily-created CoreV1Api client shared by all list calls"""
+    global _core_api
+    if _core_api is None:
+        try:
+            config.load_kube_config()  # for local testing
+        except Exception:
+            config.load_incluster_config()  # when running inside cluster
+        _core_api = client.CoreV1Api()
+    return _core_api
+
 def run_command(cmd):
-    """Run a shell command and return the output"""
-    result = subprocess.run(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    return result.stdout.decode('utf-8')
+    """Run a command given as an argv list and return its stdout as bytes"""
+    # No shell fork, and no eager UTF-8 decode of potentially large output.
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    return result.stdout
+
+async def _exec_command(cmd):
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+    stdout, _ = await proc.communicate()
+    return stdout
+
+def run_commands(cmds):
+    """Run independent commands concurrently and return their stdout bytes"""
+    async def _gather():
+        return await asyncio.gather(*(_exec_command(cmd) for cmd in cmds))
+    return asyncio.run(_gather())
 
 def get_node_metrics():
     """Get resource metrics from all nodes"""
     node_metrics = {}
-    
-    # Get all nodes
-    nodes_json = run_command("kubectl get nodes -o json")
-    nodes = json.loads(nodes_json)["items"]
-    
+
+    # List nodes through the shared client; _preload_content=False skips
+    # the swagger-model deserialization and hands back the raw JSON.
+    resp = get_core_api().list_node(_preload_content=False)
+    nodes = loads(resp.data)["items"]
+
     for node in nodes:
         node_name = node["metadata"]["name"]
         
         # Get node resource capacity
         capacity = node["status"]["capacity"]
-        cpu_capacity = float(capacity["cpu"])
-        memory_str = capacity["memory"]
-        # Convert memory string (like 8192Mi) to bytes
-        if memory_str.endswith("Ki"):
-            memory_capacity = float(memory_str[:-2]) * 1024
-        elif memory_str.endswith("Mi"):
-            memory_capacity = float(memory_str[:-2]) * 1024 * 1024
-        elif memory_str.endswith("Gi"):
-            memory_capacity = float(memory_str[:-2]) * 1024 * 1024 * 1024
-        else:
-            memory_capacity = float(memory_str)
-        
+
         node_metrics[node_name] = {
-            "cpu_capacity": cpu_capacity,
-            "memory_capacity": memory_capacity,
+            "cpu_capacity": parse_cpu(capacity["cpu"]),
+            "memory_capacity": parse_memory(capacity["memory"]),
             "cpu_used": 0,
             "memory_used": 0,
             "pods": []
@@ -56,117 +167,129 @@ def get_node_metrics():
     
     return node_metrics
 
+def _add_pod(node_metrics, pod_name, node_name, cpu_request, memory_request):
+    """Credit one pod's resource requests to the node it landed on"""
+    if node_name not in node_metrics:
+        return
+    node = node_metrics[node_name]
+    node["cpu_used"] += cpu_request
+    node["memory_used"] += memory_request
+    node["pods"].append({
+        "name": pod_name,
+        "cpu_request": cpu_request,
+        "memory_request": memory_request
+    })
+
 def update_metrics_with_pods(node_metrics, namespace):
     """Update node metrics with pod resource usage"""
-    pods_json = run_command(f"kubectl get pods -n {namespace} -o json")
-    if not pods_json.strip():
-        print(f"No pods found in namespace {namespace}")
-        return
-    
-    pods = json.loads(pods_json)["items"]
-    
+    # The Running filter is pushed server-side so non-Running pods never
+    # cross the wire.
+    resp = get_core_api().list_namespaced_pod(
+        namespace, field_selector="status.phase=Running", _preload_content=False)
+
     # Reset pod counts
     for node_name in node_metrics:
         node_metrics[node_name]["cpu_used"] = 0
         node_metrics[node_name]["memory_used"] = 0
         node_metrics[node_name]["pods"] = []
-    
-    for pod in pods:
-        if pod["status"]["phase"] != "Running":
-            continue
-            
-        pod_name = pod["metadata"]["name"]
-        node_name = pod["spec"]["nodeName"]
-        
-        if node_name not in node_metrics:
-            continue
-            
-        # Sum resource requests from all containers
-        cpu_request = 0
-        memory_request = 0
-        
-        for container in pod["spec"]["containers"]:
-            if "resources" in container and "requests" in container["resources"]:
-                requests = container["resources"]["requests"]
-                
+
+    found = False
+    if HAS_IJSON:
+        # Stream the response: a pod list is dominated by managedFields,
+        # annotations and status we never read, so only the handful of
+        # leaf values below are ever turned into Python objects.
+        pod_name = node_name = None
+        cpu_request = memory_request = 0
+        for prefix, event, value in ijson.parse(resp):
+            if prefix == "items.item.metadata.name":
+                pod_name = value
+            elif prefix == "items.item.spec.nodeName":
+                node_name = value
+            elif prefix == "items.item.spec.containers.item.resources.requests.cpu":
+                cpu_request += parse_cpu(value)
+            elif prefix == "items.item.spec.containers.item.resources.requests.memory":
+                memory_request += parse_memory(value)
+            elif prefix == "items.item" and event == "end_map":
+                found = True
+                _add_pod(node_metrics, pod_name, node_name, cpu_request, memory_request)
+                pod_name = node_name = None
+                cpu_request = memory_request = 0
+    else:
+        pods = loads(resp.data)["items"]
+        for pod in pods:
+            found = True
+            # Sum resource requests from all containers
+            cpu_request = 0
+            memory_request = 0
+            for container in pod["spec"]["containers"]:
+                requests = container.get("resources", {}).get("requests", {})
                 if "cpu" in requests:
-                    cpu_str = requests["cpu"]
-                    if cpu_str.endswith("m"):
-                        cpu_request += float(cpu_str[:-1]) / 1000
-                    else:
-                        cpu_request += float(cpu_str)
-                
+                    cpu_request += parse_cpu(requests["cpu"])
                 if "memory" in requests:
-                    mem_str = requests["memory"]
-                    if mem_str.endswith("Ki"):
-                        memory_request += float(mem_str[:-2]) * 1024
-                    elif mem_str.endswith("Mi"):
-                        memory_request += float(mem_str[:-2]) * 1024 * 1024
-                    elif mem_str.endswith("Gi"):
-                        memory_request += float(mem_str[:-2]) * 1024 * 1024 * 1024
-                    else:
-                        memory_request += float(mem_str)
-        
-        node_metrics[node_name]["cpu_used"] += cpu_request
-        node_metrics[node_name]["memory_used"] += memory_request
-        node_metrics[node_name]["pods"].append({
-            "name": pod_name,
-            "cpu_request": cpu_request,
-            "memory_request": memory_request
-        })
-    
+                    memory_request += parse_memory(requests["memory"])
+            _add_pod(node_metrics, pod["metadata"]["name"], pod["spec"]["nodeName"],
+                     cpu_request, memory_request)
+
+    if not found:
+        print(f"No pods found in namespace {namespace}")
+
     return node_metrics
 
 def get_scheduling_latency(namespace):
     """Get scheduling latency for pods in the namespace"""
-    latencies = []
-    pods_json = run_command(f"kubectl get pods -n {namespace} -o json")
-    if not pods_json.strip():
-        return latencies
-        
-    pods = json.loads(pods_json)["items"]
-    
+    resp = get_core_api().list_namespaced_pod(
+        namespace, field_selector="status.phase=Running", _preload_content=False)
+    pods = loads(resp.data)["items"]
+
+    # Collect the timestamp strings and parse them in one vectorized pass:
+    # datetime64 reads ISO-8601 at C speed, so the per-pod strptime calls
+    # collapse to two array constructions and an integer diff.
+    created_strs = []
+    scheduled_strs = []
     for pod in pods:
-        if pod["status"]["phase"] != "Running":
-            continue
-            
-        creation_time = datetime.strptime(
-            pod["metadata"]["creationTimestamp"],
-            "%Y-%m-%dT%H:%M:%SZ"
-        )
-        
-        # Find when pod was scheduled
-        scheduled_time = None
         for condition in pod["status"].get("conditions", []):
             if condition["type"] == "PodScheduled" and condition["status"] == "True":
-                scheduled_time = datetime.strptime(
-                    condition["lastTransitionTime"],
-                    "%Y-%m-%dT%H:%M:%SZ"
-                )
+                created_strs.append(pod["metadata"]["creationTimestamp"].rstrip("Z"))
+                scheduled_strs.append(condition["lastTransitionTime"].rstrip("Z"))
                 break
-        
-        if scheduled_time:
-            # Calculate latency in seconds
-            latency = (scheduled_time - creation_time).total_seconds()
-            latencies.append(latency)
-    
-    return latencies
+
+    created = np.array(created_strs, dtype="datetime64[s]")
+    scheduled = np.array(scheduled_strs, dtype="datetime64[s]")
+    return (scheduled - created) / np.timedelta64(1, "s")
+
+@lru_cache(maxsize=1)
+def _plot_figure():
+    """One reusable figure shared by all plot jobs"""
+    return plt.figure(figsize=(12, 6))
 
 def visualize_resource_utilization(default_metrics, extender_metrics, test_case):
     """Create visualizations comparing resource utilization"""
     node_names = list(default_metrics.keys())
-    
+
+    # Build the per-node metrics as SoA float arrays once; utilizations
+    # then fall out as vector expressions instead of repeated dict walks.
+    def _columns(metrics, key):
+        used = np.fromiter((metrics[n][f"{key}_used"] for n in node_names), dtype=np.float64)
+        capacity = np.fromiter((metrics[n][f"{key}_capacity"] for n in node_names), dtype=np.float64)
+        return used, capacity
+
+    d_cpu_u, d_cpu_c = _columns(default_metrics, "cpu")
+    e_cpu_u, e_cpu_c = _columns(extender_metrics, "cpu")
+    d_mem_u, d_mem_c = _columns(default_metrics, "memory")
+    e_mem_u, e_mem_c = _columns(extender_metrics, "memory")
+
     # CPU utilization comparison
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
+    fig = _plot_figure()
+    fig.clear()
+    fig.set_size_inches(12, 6)
+    ax = fig.subplots()
+
     x = np.arange(len(node_names))
     width = 0.35
-    
-    default_cpu_util = [default_metrics[node]["cpu_used"] / default_metrics[node]["cpu_capacity"] * 100 
-                        for node in node_names]
-    extender_cpu_util = [extender_metrics[node]["cpu_used"] / extender_metrics[node]["cpu_capacity"] * 100 
-                         for node in node_names]
-    
+
+    default_cpu_util = 100.0 * d_cpu_u / d_cpu_c
+    extender_cpu_util = 100.0 * e_cpu_u / e_cpu_c
+
     ax.bar(x - width/2, default_cpu_util, width, label='Default Scheduler')
     ax.bar(x + width/2, extender_cpu_util, width, label='Scheduler with Extender')
     
@@ -177,17 +300,16 @@ def visualize_resource_utilization(default_metrics, extender_metrics, test_case)
     ax.legend()
     ax.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
-    plt.savefig(f"{RESULTS_DIR}/test-case-{test_case}-cpu-utilization.png")
-    
+    fig.tight_layout()
+    fig.savefig(f"{RESULTS_DIR}/test-case-{test_case}-cpu-utilization.png")
+
     # Memory utilization comparison
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    default_mem_util = [default_metrics[node]["memory_used"] / default_metrics[node]["memory_capacity"] * 100 
-                        for node in node_names]
-    extender_mem_util = [extender_metrics[node]["memory_used"] / extender_metrics[node]["memory_capacity"] * 100 
-                         for node in node_names]
-    
+    fig.clear()
+    ax = fig.subplots()
+
+    default_mem_util = 100.0 * d_mem_u / d_mem_c
+    extender_mem_util = 100.0 * e_mem_u / e_mem_c
+
     ax.bar(x - width/2, default_mem_util, width, label='Default Scheduler')
     ax.bar(x + width/2, extender_mem_util, width, label='Scheduler with Extender')
     
@@ -198,20 +320,22 @@ def visualize_resource_utilization(default_metrics, extender_metrics, test_case)
     ax.legend()
     ax.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
-    plt.savefig(f"{RESULTS_DIR}/test-case-{test_case}-memory-utilization.png")
+    fig.tight_layout()
+    fig.savefig(f"{RESULTS_DIR}/test-case-{test_case}-memory-utilization.png")
     
     # Save metrics to file
-    with open(f"{RESULTS_DIR}/test-case-{test_case}-metrics.json", "w") as f:
-        json.dump({
-            "default_scheduler": default_metrics,
-            "scheduler_with_extender": extender_metrics
-        }, f, indent=2)
+    write_json(f"{RESULTS_DIR}/test-case-{test_case}-metrics.json", {
+        "default_scheduler": default_metrics,
+        "scheduler_with_extender": extender_metrics
+    })
 
 def visualize_scheduling_latency(default_latencies, extender_latencies, test_case):
     """Create visualizations comparing scheduling latency"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
+    fig = _plot_figure()
+    fig.clear()
+    fig.set_size_inches(10, 6)
+    ax = fig.subplots()
+
     # Create histogram
     ax.hist(default_latencies, alpha=0.5, label='Default Scheduler')
     ax.hist(extender_latencies, alpha=0.5, label='Scheduler with Extender')
@@ -222,111 +346,154 @@ def visualize_scheduling_latency(default_latencies, extender_latencies, test_cas
     ax.legend()
     ax.grid(True, linestyle='--', alpha=0.7)
     
-    plt.tight_layout()
-    plt.savefig(f"{RESULTS_DIR}/test-case-{test_case}-latency.png")
-    
-    # Save latency data to file
-    with open(f"{RESULTS_DIR}/test-case-{test_case}-latency.json", "w") as f:
-        json.dump({
-            "default_scheduler": default_latencies,
-            "scheduler_with_extender": extender_latencies,
-            "default_avg": sum(default_latencies) / len(default_latencies) if default_latencies else 0,
-            "extender_avg": sum(extender_latencies) / len(extender_latencies) if extender_latencies else 0
-        }, f, indent=2)
+    fig.tight_layout()
+    fig.savefig(f"{RESULTS_DIR}/test-case-{test_case}-latency.png")
+    
+    # Save latency data to file; tolist() keeps the payload serializable
+    # by the stdlib json fallback when orjson is absent.
+    write_json(f"{RESULTS_DIR}/test-case-{test_case}-latency.json", {
+        "default_scheduler": default_latencies.tolist(),
+        "scheduler_with_extender": extender_latencies.tolist(),
+        "default_avg": float(default_latencies.mean()) if default_latencies.size else 0.0,
+        "extender_avg": float(extender_latencies.mean()) if extender_latencies.size else 0.0
+    })
+
+def drf_std(cpu_used, cpu_capacity, memory_used, memory_capacity):
+    """Standard deviation of per-node dominant shares in one fused sweep"""
+    n = cpu_used.shape[0]
+    if n == 0:
+        return 0.0
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        cpu_share = cpu_used[i] / cpu_capacity[i]
+        memory_share = memory_used[i] / memory_capacity[i]
+        dominant = cpu_share if cpu_share > memory_share else memory_share
+        total += dominant
+        total_sq += dominant * dominant
+    mean = total / n
+    variance = total_sq / n - mean * mean
+    return variance ** 0.5 if variance > 0 else 0.0
+
+if HAS_NUMBA:
+    # Explicit signature skips type inference at call time; cache=True
+    # reuses the compiled object code across process starts.
+    drf_std = numba.njit(
+        "float64(float64[::1], float64[::1], float64[::1], float64[::1])",
+        cache=True, fastmath=True)(drf_std)
+
+def _warmup():
+    """Force JIT compilation before the evaluation clock starts"""
+    if HAS_NUMBA:
+        empty = np.empty(0, dtype=np.float64)
+        drf_std(empty, empty, empty, empty)
 
 def calculate_dominant_share_metric(metrics):
     """
     Calculate a metric based on dominant resource share fairness.
     Lower values indicate better distribution according to dominant resource fairness.
     """
-    node_scores = []
-    
-    for node_name, node_data in metrics.items():
-        if node_data["cpu_capacity"] == 0 or node_data["memory_capacity"] == 0:
-            continue
-            
-        cpu_share = node_data["cpu_used"] / node_data["cpu_capacity"]
-        memory_share = node_data["memory_used"] / node_data["memory_capacity"]
-        
-        # Dominant share is the maximum of all resource shares
-        dominant_share = max(cpu_share, memory_share)
-        node_scores.append(dominant_share)
-    
-    if not node_scores:
+    # Materialize the node metrics as four parallel float64 arrays (SoA)
+    # so the reduction runs over contiguous memory.
+    valid = [d for d in metrics.values()
+             if d["cpu_capacity"] != 0 and d["memory_capacity"] != 0]
+    if not valid:
         return 0
-    
+
+    cpu_used = np.fromiter((d["cpu_used"] for d in valid), dtype=np.float64)
+    cpu_capacity = np.fromiter((d["cpu_capacity"] for d in valid), dtype=np.float64)
+    memory_used = np.fromiter((d["memory_used"] for d in valid), dtype=np.float64)
+    memory_capacity = np.fromiter((d["memory_capacity"] for d in valid), dtype=np.float64)
+
     # For fairness, we want the standard deviation of dominant shares to be low
     # Lower standard deviation means more equal allocation according to DRF
-    return np.std(node_scores)
+    if HAS_NUMBA:
+        return drf_std(cpu_used, cpu_capacity, memory_used, memory_capacity)
+    return np.std(np.maximum(cpu_used / cpu_capacity, memory_used / memory_capacity))
+
+def deploy_and_measure(yaml_file, namespace):
+    """Deploy test resources and gather metrics for one scheduler arm"""
+    print(f"Deploying resources from {yaml_file}...")
+    run_command(["kubectl", "apply", "-f", yaml_file])
+
+    # `kubectl wait --all` only matches pods that already exist, so first
+    # wait for the controllers to create the count the manifest promises,
+    # then block until those pods are Ready — the Running state that the
+    # metrics and latency passes filter on.
+    _, expected_pods = yaml_meta(yaml_file)
+    print(f"Waiting for {expected_pods} pods to be created...")
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        out = run_command(["kubectl", "get", "pods", "-n", namespace,
+                           "--no-headers", "-o", "name"])
+        if len(out.splitlines()) >= expected_pods:
+            break
+        time.sleep(2)
+
+    print("Waiting for pods to be ready...")
+    run_command(["kubectl", "wait", "--for=condition=Ready", "pod", "--all",
+                 "-n", namespace, "--timeout=120s"])
+
+    node_metrics = get_node_metrics()
+    update_metrics_with_pods(node_metrics, namespace)
+    latencies = get_scheduling_latency(namespace)
+
+    return node_metrics, latencies
 
 def run_test_case(test_case, default_yaml, extender_yaml):
     """Run a test case and gather metrics"""
     print(f"\n--- Running Test Case {test_case} ---")
-    
-    # Clean up any previous test resources
-    cleanup_cmd = f"kubectl delete -f {default_yaml} --ignore-not-found=true && kubectl delete -f {extender_yaml} --ignore-not-found=true"
-    run_command(cleanup_cmd)
-    time.sleep(5)  # Give time for cleanup
-    
-    # Deploy test resources for default scheduler
-    print(f"Deploying resources with default scheduler...")
-    run_command(f"kubectl apply -f {default_yaml}")
-    
-    # Wait for pods to be scheduled and running
-    print("Waiting for pods to be scheduled...")
-    time.sleep(30)  # Adjust as needed
-    
-    # Gather metrics for default scheduler
-    default_namespace = f"sched-test{'-' + test_case if test_case else ''}"
-    node_metrics = get_node_metrics()
-    update_metrics_with_pods(node_metrics, default_namespace)
-    default_metrics = json.loads(json.dumps(node_metrics))  # Deep copy
-    
-    # Get scheduling latency
-    default_latencies = get_scheduling_latency(default_namespace)
-    
-    # Calculate dominant share metric
+
+    # The namespace comes from the manifest itself rather than being
+    # re-derived from the test-case name; yaml_meta parses each file once.
+    default_namespace, _ = yaml_meta(default_yaml)
+    extender_namespace, _ = yaml_meta(extender_yaml)
+
+    # Clean up any previous test resources and wait for the deletions to
+    # finish instead of sleeping a fixed interval.
+    cleanup_cmds = [
+        ["kubectl", "delete", "-f", default_yaml, "--ignore-not-found=true"],
+        ["kubectl", "delete", "-f", extender_yaml, "--ignore-not-found=true"],
+    ]
+    run_commands(cleanup_cmds)
+    run_commands([["kubectl", "wait", "--for=delete", "pod", "--all",
+                   "-n", namespace, "--timeout=60s"]
+                  for namespace in (default_namespace, extender_namespace)])
+
+    # The two arms target disjoint namespaces and the work is HTTP-bound,
+    # so their deploy+measure pipelines run concurrently.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        default_future = executor.submit(deploy_and_measure, default_yaml, default_namespace)
+        extender_future = executor.submit(deploy_and_measure, extender_yaml, extender_namespace)
+        default_metrics, default_latencies = default_future.result()
+        extender_metrics, extender_latencies = extender_future.result()
+
+    # Calculate dominant share metrics
     default_drf_metric = calculate_dominant_share_metric(default_metrics)
     print(f"Default Scheduler DRF Metric: {default_drf_metric}")
-    
-    # Clean up default scheduler resources
-    run_command(f"kubectl delete -f {default_yaml}")
-    time.sleep(20)  # Give time for cleanup
-    
-    # Deploy test resources for scheduler with extender
-    print(f"Deploying resources to test scheduler with extender...")
-    run_command(f"kubectl apply -f {extender_yaml}")
-    
-    # Wait for pods to be scheduled and running
-    print("Waiting for pods to be scheduled...")
-    time.sleep(30)  # Adjust as needed
-    
-    # Gather metrics for scheduler with extender
-    extender_namespace = f"sched-test{'-' + test_case if test_case else ''}-extender"
-    node_metrics = get_node_metrics()
-    update_metrics_with_pods(node_metrics, extender_namespace)
-    extender_metrics = node_metrics
-    
-    # Get scheduling latency
-    extender_latencies = get_scheduling_latency(extender_namespace)
-    
-    # Calculate dominant share metric
+
     extender_drf_metric = calculate_dominant_share_metric(extender_metrics)
     print(f"Scheduler with Extender DRF Metric: {extender_drf_metric}")
+
+    # Clean up test resources
+    run_commands(cleanup_cmds)
     
-    # Create visualizations
-    visualize_resource_utilization(default_metrics, extender_metrics, test_case)
-    visualize_scheduling_latency(default_latencies, extender_latencies, test_case)
+    # Queue the visualizations; the runner moves on to the next test case
+    # while the plot worker renders.
+    _plot_futures.append(_plot_executor.submit(
+        visualize_resource_utilization, default_metrics, extender_metrics, test_case))
+    _plot_futures.append(_plot_executor.submit(
+        visualize_scheduling_latency, default_latencies, extender_latencies, test_case))
     
     # Save summary for this test case
     summary = {
         "default_scheduler": {
             "drf_metric": default_drf_metric,
-            "avg_latency": sum(default_latencies) / len(default_latencies) if default_latencies else 0
+            "avg_latency": float(default_latencies.mean()) if default_latencies.size else 0.0
         },
         "scheduler_with_extender": {
             "drf_metric": extender_drf_metric,
-            "avg_latency": sum(extender_latencies) / len(extender_latencies) if extender_latencies else 0
+            "avg_latency": float(extender_latencies.mean()) if extender_latencies.size else 0.0
         }
     }
     
@@ -359,88 +526,110 @@ def main():
     ]
     
     overall_summary = {}
-    
-    for tc in test_cases:
-        summary = run_test_case(tc["name"], tc["default_yaml"], tc["extender_yaml"])
-        overall_summary[tc["name"]] = {
-            "description": tc["description"],
-            "results": summary
-        }
-    
+
+    # Each test case is appended to a JSONL stream as soon as it finishes,
+    # so a crash mid-run loses at most the case in flight.
+    with open(f"{RESULTS_DIR}/stream.jsonl", "wb") as stream:
+        for tc in test_cases:
+            summary = run_test_case(tc["name"], tc["default_yaml"], tc["extender_yaml"])
+            overall_summary[tc["name"]] = {
+                "description": tc["description"],
+                "results": summary
+            }
+            append_jsonl(stream, {
+                "test_case": tc["name"],
+                "description": tc["description"],
+                "results": summary
+            })
+    
+    # Drain outstanding plot jobs before reporting; result() re-raises any
+    # exception a plot job hit instead of dropping it on the floor.
+    _plot_executor.shutdown(wait=True)
+    for future in _plot_futures:
+        future.result()
+
     # Save overall summary
-    with open(f"{RESULTS_DIR}/overall-summary.json", "w") as f:
-        json.dump(overall_summary, f, indent=2)
+    write_json(f"{RESULTS_DIR}/overall-summary.json", overall_summary)
     
-    # Generate summary text file
-    with open(f"{RESULTS_DIR}/summary.txt", "w") as f:
-        f.write("Scheduler Evaluation Summary\n")
-        f.write("==========================\n\n")
-        
-        for tc_name, tc_data in overall_summary.items():
-            f.write(f"Test Case {tc_name}: {tc_data['description']}\n")
-            f.write("-" * (19 + len(tc_data['description'])) + "\n")
-            
-            default_metrics = tc_data['results']['default_scheduler']
-            extender_metrics = tc_data['results']['scheduler_with_extender']
-            
-            f.write(f"Default Scheduler:\n")
-            f.write(f"  - DRF Metric (lower is better): {default_metrics['drf_metric']:.4f}\n")
-            f.write(f"  - Avg Scheduling Latency: {default_metrics['avg_latency']:.4f} seconds\n\n")
-            
-            f.write(f"Scheduler with Extender:\n")
-            f.write(f"  - DRF Metric (lower is better): {extender_metrics['drf_metric']:.4f}\n")
-            f.write(f"  - Avg Scheduling Latency: {extender_metrics['avg_latency']:.4f} seconds\n\n")
-            
-            # Calculate improvements
-            drf_improvement = (default_metrics['drf_metric'] - extender_metrics['drf_metric']) / default_metrics['drf_metric'] * 100 if default_metrics['drf_metric'] != 0 else 0
-            latency_change = (extender_metrics['avg_latency'] - default_metrics['avg_latency']) / default_metrics['avg_latency'] * 100 if default_metrics['avg_latency'] != 0 else 0
-            
-            f.write(f"Improvements:\n")
-            if drf_improvement > 0:
-                f.write(f"  - Fairness Improvement: {drf_improvement:.2f}%\n")
-            else:
-                f.write(f"  - Fairness Change: {drf_improvement:.2f}%\n")
-                
-            if latency_change <= 0:
-                f.write(f"  - Latency Improvement: {-latency_change:.2f}%\n")
-            else:
-                f.write(f"  - Latency Overhead: {latency_change:.2f}%\n")
-            
-            f.write("\n\n")
-        
-        f.write("Overall Conclusion:\n")
-        f.write("-----------------\n")
-        
-        # Calculate average improvements across all test cases
-        avg_drf_improvement = np.mean([
-            (tc_data['results']['default_scheduler']['drf_metric'] - tc_data['results']['scheduler_with_extender']['drf_metric']) / tc_data['results']['default_scheduler']['drf_metric'] * 100 
-            if tc_data['results']['default_scheduler']['drf_metric'] != 0 else 0
-            for tc_name, tc_data in overall_summary.items()
-        ])
-        
-        avg_latency_change = np.mean([
-            (tc_data['results']['scheduler_with_extender']['avg_latency'] - tc_data['results']['default_scheduler']['avg_latency']) / tc_data['results']['default_scheduler']['avg_latency'] * 100
-            if tc_data['results']['default_scheduler']['avg_latency'] != 0 else 0
-            for tc_name, tc_data in overall_summary.items()
-        ])
-        
-        if avg_drf_improvement > 10:
-            f.write("The scheduler extender shows a SIGNIFICANT improvement in resource fairness ")
-        elif avg_drf_improvement > 0:
-            f.write("The scheduler extender shows a MODEST improvement in resource fairness ")
+    # Generate summary text file: accumulate the report in memory and
+    # flush it with a single write instead of one syscall per line.
+    lines = []
+    lines.append("Scheduler Evaluation Summary\n")
+    lines.append("==========================\n\n")
+
+    for tc_name, tc_data in overall_summary.items():
+        lines.append(f"Test Case {tc_name}: {tc_data['description']}\n")
+        lines.append("-" * (19 + len(tc_data['description'])) + "\n")
+
+        default_metrics = tc_data['results']['default_scheduler']
+        extender_metrics = tc_data['results']['scheduler_with_extender']
+
+        lines.append("Default Scheduler:\n")
+        lines.append(f"  - DRF Metric (lower is better): {format(default_metrics['drf_metric'], '.4f')}\n")
+        lines.append(f"  - Avg Scheduling Latency: {format(default_metrics['avg_latency'], '.4f')} seconds\n\n")
+
+        lines.append("Scheduler with Extender:\n")
+        lines.append(f"  - DRF Metric (lower is better): {format(extender_metrics['drf_metric'], '.4f')}\n")
+        lines.append(f"  - Avg Scheduling Latency: {format(extender_metrics['avg_latency'], '.4f')} seconds\n\n")
+
+        # Calculate improvements
+        drf_improvement = (default_metrics['drf_metric'] - extender_metrics['drf_metric']) / default_metrics['drf_metric'] * 100 if default_metrics['drf_metric'] != 0 else 0
+        latency_change = (extender_metrics['avg_latency'] - default_metrics['avg_latency']) / default_metrics['avg_latency'] * 100 if default_metrics['avg_latency'] != 0 else 0
+
+        lines.append("Improvements:\n")
+        if drf_improvement > 0:
+            lines.append(f"  - Fairness Improvement: {format(drf_improvement, '.2f')}%\n")
         else:
-            f.write("The scheduler extender does not show an improvement in resource fairness ")
-            
-        f.write(f"with an average improvement of {avg_drf_improvement:.2f}% in DRF metrics.\n\n")
-        
-        if avg_latency_change > 10:
-            f.write(f"However, using the scheduler extender incurs a scheduling latency overhead of {avg_latency_change:.2f}%.\n")
-        elif avg_latency_change > 0:
-            f.write(f"The scheduler extender introduces a minimal latency overhead of {avg_latency_change:.2f}%.\n")
+            lines.append(f"  - Fairness Change: {format(drf_improvement, '.2f')}%\n")
+
+        if latency_change <= 0:
+            lines.append(f"  - Latency Improvement: {format(-latency_change, '.2f')}%\n")
         else:
-            f.write(f"Interestingly, the scheduler extender actually improves scheduling latency by {-avg_latency_change:.2f}%.\n")
-    
+            lines.append(f"  - Latency Overhead: {format(latency_change, '.2f')}%\n")
+
+        lines.append("\n\n")
+
+    lines.append("Overall Conclusion:\n")
+    lines.append("-----------------\n")
+
+    # Calculate average improvements across all test cases as one
+    # vectorized pass over per-test-case columns.
+    results = [tc_data['results'] for tc_data in overall_summary.values()]
+    drf_def = np.array([r['default_scheduler']['drf_metric'] for r in results])
+    drf_ext = np.array([r['scheduler_with_extender']['drf_metric'] for r in results])
+    lat_def = np.array([r['default_scheduler']['avg_latency'] for r in results])
+    lat_ext = np.array([r['scheduler_with_extender']['avg_latency'] for r in results])
+
+    avg_drf_improvement = np.mean(np.where(
+        drf_def != 0,
+        (drf_def - drf_ext) / np.where(drf_def != 0, drf_def, 1.0) * 100,
+        0.0))
+    avg_latency_change = np.mean(np.where(
+        lat_def != 0,
+        (lat_ext - lat_def) / np.where(lat_def != 0, lat_def, 1.0) * 100,
+        0.0))
+
+    if avg_drf_improvement > 10:
+        lines.append("The scheduler extender shows a SIGNIFICANT improvement in resource fairness ")
+    elif avg_drf_improvement > 0:
+        lines.append("The scheduler extender shows a MODEST improvement in resource fairness ")
+    else:
+        lines.append("The scheduler extender does not show an improvement in resource fairness ")
+
+    lines.append(f"with an average improvement of {format(avg_drf_improvement, '.2f')}% in DRF metrics.\n\n")
+
+    if avg_latency_change > 10:
+        lines.append(f"However, using the scheduler extender incurs a scheduling latency overhead of {format(avg_latency_change, '.2f')}%.\n")
+    elif avg_latency_change > 0:
+        lines.append(f"The scheduler extender introduces a minimal latency overhead of {format(avg_latency_change, '.2f')}%.\n")
+    else:
+        lines.append(f"Interestingly, the scheduler extender actually improves scheduling latency by {format(-avg_latency_change, '.2f')}%.\n")
+
+    with open(f"{RESULTS_DIR}/summary.txt", "w") as f:
+        f.write("".join(lines))
+
     print("\nEvaluation complete! Results saved to the results directory.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    _warmup()
+    main()
\ No newline at end of file
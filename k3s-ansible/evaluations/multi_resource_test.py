@@ -6,7 +6,7 @@ import os
 import subprocess
 import time
 from datetime import datetime
-from kubernetes import client, config
+from kubernetes import client, config, watch
 
 def parse_args():
     parser = argparse.ArgumentParser(description='Test multi-resource scheduler pod scheduling')
@@ -57,11 +57,6 @@ def submit_pod(manifest):
         namespace=manifest['metadata']['namespace']
     )
 
-def check_pod_status(name, namespace):
-    api = client.CoreV1Api()
-    pod = api.read_namespaced_pod(name=name, namespace=namespace)
-    return pod.status.phase, pod.status.conditions
-
 def run_multi_resource_test(args):
     # Initialize Kubernetes client
     try:
@@ -95,35 +90,59 @@ def run_multi_resource_test(args):
     unscheduled_pods = []
     
     print("Monitoring pod status...")
-    while time.time() - start_time < args.timeout:
-        all_scheduled = True
-        for pod_name in pods:
+    # A single watch stream pushes pod updates over one long-lived
+    # connection, so scheduling is detected as events arrive instead of
+    # being polled for.
+    w = watch.Watch()
+    try:
+        for event in w.stream(api.list_namespaced_pod,
+                              namespace=args.namespace,
+                              label_selector='app=multi-resource-test',
+                              timeout_seconds=args.timeout):
+            pod = event['object']
+            pod_name = pod.metadata.name
+            if pod_name not in pods:
+                continue
+
+            for condition in (pod.status.conditions or []):
+                if condition.type == 'PodScheduled' and condition.status == 'True':
+                    if pod_name not in scheduled_pods:
+                        scheduled_pods.append(pod_name)
+                        print(f"Pod {pod_name} has been scheduled")
+                    break
+
+            if len(scheduled_pods) == args.num_pods:
+                print("All pods have been scheduled!")
+                w.stop()
+                break
+    except Exception as e:
+        # A dropped watch (connection reset, 410 Gone) is an infrastructure
+        # blip, not a scheduling verdict; keep polling out the deadline.
+        print(f"Error watching pods, falling back to polling: {e}")
+        while (time.time() - start_time < args.timeout
+               and len(scheduled_pods) < args.num_pods):
             try:
-                phase, conditions = check_pod_status(pod_name, args.namespace)
-                
-                # Check if pod is scheduled
-                scheduled = False
-                for condition in conditions:
-                    if condition.type == 'PodScheduled' and condition.status == 'True':
-                        scheduled = True
-                        if pod_name not in scheduled_pods:
+                resp = api.list_namespaced_pod(
+                    namespace=args.namespace,
+                    label_selector='app=multi-resource-test'
+                )
+                for pod in resp.items:
+                    pod_name = pod.metadata.name
+                    if pod_name not in pods or pod_name in scheduled_pods:
+                        continue
+                    for condition in (pod.status.conditions or []):
+                        if condition.type == 'PodScheduled' and condition.status == 'True':
                             scheduled_pods.append(pod_name)
                             print(f"Pod {pod_name} has been scheduled")
-                        break
-                
-                if not scheduled:
-                    all_scheduled = False
-                    if pod_name not in unscheduled_pods:
-                        unscheduled_pods.append(pod_name)
-            except Exception as e:
-                print(f"Error checking pod {pod_name} status: {e}")
-                all_scheduled = False
-        
-        if all_scheduled and len(scheduled_pods) == args.num_pods:
-            print("All pods have been scheduled!")
-            break
-        
-        time.sleep(args.poll_interval)
+                            break
+            except Exception as poll_error:
+                print(f"Error polling pods: {poll_error}")
+            if len(scheduled_pods) == args.num_pods:
+                print("All pods have been scheduled!")
+                break
+            time.sleep(args.poll_interval)
+
+    unscheduled_pods = [name for name in pods if name not in scheduled_pods]
     
     # Collect results
     end_time = time.time()
@@ -2,12 +2,31 @@
 import time
 import datetime
 import argparse
-import matplotlib.pyplot as plt
-import pandas as pd
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
-from kubernetes import client, config
+from kubernetes import client, config, watch
+from kubernetes.client.rest import ApiException
 import os
 import json
+import logging
+import logging.handlers
+
+# orjson serializes datetime values natively at C speed; stdlib json
+# remains the fallback.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Numba compiles the latency statistics kernel for large --num-pods
+# sweeps; plain NumPy is the fallback.
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 # Configure command-line arguments.
 parser = argparse.ArgumentParser(description="Evaluate and compare scheduler performance by submitting many pods and recording scheduling times.")
@@ -25,38 +44,73 @@ parser.add_argument("--memory-request", default="128Mi", help="Memory request fo
 parser.add_argument("--priority", type=int, default=0, help="Priority for test pods (0-100)")
 parser.add_argument("--output-file", default="scheduler_comparison.json", help="File to save results to")
 parser.add_argument("--load-results", action="store_true", help="Load and plot previous results instead of running new tests")
+parser.add_argument("--no-plot", action="store_true", help="Skip plot generation (useful for headless/CI runs)")
 args = parser.parse_args()
 
+def _pyplot():
+    """Import matplotlib lazily so plain submit-and-save runs skip it"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    # Try to use seaborn for prettier plots
+    try:
+        import seaborn as sns
+        sns.set_theme(style="whitegrid")
+    except ImportError:
+        pass
+    return plt
+
+# Per-pod scheduling events are logged through a memory handler that
+# flushes in batches, so the watch consumer never blocks on stdout.
+logger = logging.getLogger("podcreator")
+_log_handler = logging.handlers.MemoryHandler(capacity=128, target=logging.StreamHandler())
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+
 # Load Kubernetes configuration.
 try:
     config.load_kube_config()  # for local testing
 except:
     config.load_incluster_config()  # when running inside cluster
-v1 = client.CoreV1Api()
 
-def submit_pod(pod_name, namespace, image, command, scheduler_name=None, cpu_request="100m", memory_request="128Mi", priority=0):
-    """Create a pod with the given name and scheduler."""
-    # Create priority class if needed
-    priority_class_name = None
-    if priority > 0:
-        priority_class_name = f"priority-{priority}"
+# A widened urllib3 pool lets concurrent submissions share one ApiClient
+# without serializing on connections.
+_configuration = client.Configuration.get_default_copy()
+_configuration.connection_pool_maxsize = 32
+v1 = client.CoreV1Api(api_client=client.ApiClient(_configuration))
+scheduling_v1 = client.SchedulingV1Api(api_client=v1.api_client)
+
+@functools.lru_cache(maxsize=None)
+def ensure_priority_class(priority):
+    """Make sure the priority class for `priority` exists, once per value."""
+    if priority <= 0:
+        return None
+    priority_class_name = f"priority-{priority}"
+    try:
+        # Check if priority class exists
+        scheduling_v1.read_priority_class(name=priority_class_name)
+    except:
+        # Create priority class if it doesn't exist
+        priority_class = client.V1PriorityClass(
+            metadata=client.V1ObjectMeta(name=priority_class_name),
+            value=priority,
+            global_default=False,
+            description=f"Priority class for test pods with priority {priority}"
+        )
         try:
-            # Check if priority class exists
-            client.SchedulingV1Api().read_priority_class(name=priority_class_name)
-        except:
-            # Create priority class if it doesn't exist
-            priority_class = client.V1PriorityClass(
-                metadata=client.V1ObjectMeta(name=priority_class_name),
-                value=priority,
-                global_default=False,
-                description=f"Priority class for test pods with priority {priority}"
-            )
-            client.SchedulingV1Api().create_priority_class(body=priority_class)
-    
-    # Create pod manifest
-    pod_manifest = client.V1Pod(
+            scheduling_v1.create_priority_class(body=priority_class)
+        except ApiException as e:
+            # The two --compare arms can race through the read probe at the
+            # same time; the loser's create hits 409 and that is fine.
+            if e.status != 409:
+                raise
+    return priority_class_name
+
+@functools.lru_cache(maxsize=None)
+def _pod_manifest_template(image, command, scheduler_name, cpu_request, memory_request, priority_class_name):
+    """Build and serialize the shared pod manifest once per configuration."""
+    pod = client.V1Pod(
         metadata=client.V1ObjectMeta(
-            name=pod_name,
             labels={"app": "scheduler-test", "scheduler": scheduler_name or "default"}
         ),
         spec=client.V1PodSpec(
@@ -75,7 +129,7 @@ def submit_pod(pod_name, namespace, image, command, scheduler_name=None, cpu_req
                 client.V1Container(
                     name="container",
                     image=image,
-                    command=command,
+                    command=list(command),
                     resources=client.V1ResourceRequirements(
                         requests={"cpu": cpu_request, "memory": memory_request}
                     )
@@ -83,8 +137,28 @@ def submit_pod(pod_name, namespace, image, command, scheduler_name=None, cpu_req
             ]
         )
     )
+    return v1.api_client.sanitize_for_serialization(pod)
+
+def submit_pod(pod_name, namespace, image, command, scheduler_name=None, cpu_request="100m", memory_request="128Mi", priority_class_name=None):
+    """Create a pod with the given name and scheduler."""
+    # The manifest is sanitized to a plain dict once per configuration;
+    # per pod we only splice in the name and POST the raw JSON through
+    # the shared ApiClient, skipping the Swagger marshaling path while
+    # reusing its warm TLS connection pool and auth.
+    template = _pod_manifest_template(image, tuple(command), scheduler_name,
+                                      cpu_request, memory_request, priority_class_name)
+    body = {**template, "metadata": {**template["metadata"], "name": pod_name}}
     try:
-        v1.create_namespaced_pod(namespace=namespace, body=pod_manifest)
+        v1.api_client.call_api(
+            '/api/v1/namespaces/{namespace}/pods', 'POST',
+            path_params={'namespace': namespace},
+            header_params={'Content-Type': 'application/json',
+                           'Accept': 'application/json'},
+            body=body,
+            auth_settings=['BearerToken'],
+            response_type='object',
+            _return_http_data_only=True
+        )
     except Exception as e:
         print(f"Error creating pod {pod_name}: {e}")
 
@@ -98,7 +172,29 @@ def get_pod_start_time(pod_name, namespace):
         print(f"Error reading pod {pod_name}: {e}")
         return None
 
-def run_test(num_pods, namespace, image, command, poll_interval, timeout, scheduler_name=None, 
+def _iter_pods(namespace, label_selector):
+    """Page through the pod LIST with limit/continue so each chunk can be
+    collected before the next arrives instead of holding the full list."""
+    # No resource_version on the first page: with resourceVersion=0 the
+    # apiserver serves from its watch cache and ignores limit, returning
+    # the whole collection in one unbounded response.
+    cont = None
+    while True:
+        if cont is None:
+            resp = v1.list_namespaced_pod(
+                namespace=namespace, label_selector=label_selector,
+                limit=500)
+        else:
+            resp = v1.list_namespaced_pod(
+                namespace=namespace, label_selector=label_selector,
+                limit=500, _continue=cont)
+        for pod in resp.items:
+            yield pod
+        cont = resp.metadata._continue
+        if not cont:
+            return
+
+def run_test(num_pods, namespace, image, command, poll_interval, timeout, scheduler_name=None,
              cpu_request="100m", memory_request="128Mi", priority=0):
     """Run a test with the specified scheduler and pod configuration."""
     # Use a prefix to distinguish between schedulers
@@ -107,78 +203,145 @@ def run_test(num_pods, namespace, image, command, poll_interval, timeout, schedu
     
     # Add a timestamp to make pod names unique for each run
     timestamp = int(time.time())
-    
-    submission_times = {}  # pod name -> submission timestamp
-    schedule_times = {}    # pod name -> pod start (scheduling) timestamp
+
+    # SoA layout: two parallel datetime64 columns populated in place,
+    # with a name->index dict for O(1) lookup in the watch loop.
+    name_prefix = f"{prefix}-test-pod-{timestamp}-"
+    pod_names = [name_prefix + str(i) for i in range(num_pods)]
+    name_to_idx = {name: i for i, name in enumerate(pod_names)}
+    # Submission capture is one time.time_ns() call and an int64 store;
+    # no tz-aware datetime object is allocated in the hot loop.
+    sub_ns = np.empty(num_pods, dtype=np.int64)
+    sched_ts = np.full(num_pods, np.datetime64("NaT"), dtype="datetime64[us]")
 
     print(f"Submitting {num_pods} pods using scheduler: {scheduler_name or 'default'}")
     print(f"Pod configuration: CPU={cpu_request}, Memory={memory_request}, Priority={priority}")
-    
-    for i in range(num_pods):
-        pod_name = f"{prefix}-test-pod-{timestamp}-{i}"
-        submission_times[pod_name] = datetime.datetime.now(datetime.timezone.utc)
-        submit_pod(pod_name, namespace, image, command, scheduler_name, 
-                  cpu_request, memory_request, priority)
-        # Space out submissions slightly to simulate a burst
-        time.sleep(0.1)
+
+    # One existence check per priority value, not one per pod
+    priority_class_name = ensure_priority_class(priority)
+
+    # Submission is pure apiserver I/O, so dispatch the pods through a
+    # thread pool and let the whole burst hit the scheduler at once.
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        futures = []
+        for i, pod_name in enumerate(pod_names):
+            sub_ns[i] = time.time_ns()
+            futures.append(executor.submit(
+                submit_pod, pod_name, namespace, image, command, scheduler_name,
+                cpu_request, memory_request, priority_class_name))
+        for future in as_completed(futures):
+            future.result()
 
     print("Waiting for pods to be scheduled...")
-    end_time = time.time() + timeout
-    while len(schedule_times) < num_pods and time.time() < end_time:
-        pod_list = v1.list_namespaced_pod(
-            namespace=namespace, 
-            label_selector=f"app=scheduler-test,scheduler={scheduler_name or 'default'}"
-        ).items
-        
-        for pod in pod_list:
-            name = pod.metadata.name
-            if name in submission_times and name not in schedule_times:
-                if pod.status.start_time is not None:
-                    schedule_times[name] = pod.status.start_time
-                    print(f"Pod {name} scheduled at {pod.status.start_time}")
-        time.sleep(poll_interval)
+    # One streaming WATCH replaces the repeated LISTs: events arrive the
+    # moment a pod starts instead of up to poll_interval later, and the
+    # apiserver serves the initial state from its watch cache
+    # (resource_version=0) rather than etcd. return_type="object" keeps
+    # each event as a plain dict, skipping the V1Pod model construction
+    # when only the name and start time are read.
+    scheduled = 0
+    label_selector = f"app=scheduler-test,scheduler={scheduler_name or 'default'}"
+    w = watch.Watch(return_type="object")
+    try:
+        for event in w.stream(
+                v1.list_namespaced_pod,
+                namespace=namespace,
+                label_selector=label_selector,
+                resource_version="0",
+                timeout_seconds=timeout):
+            pod = event['object']
+            idx = name_to_idx.get(pod["metadata"]["name"])
+            if idx is not None and np.isnat(sched_ts[idx]):
+                start_time = pod.get("status", {}).get("startTime")
+                if start_time:
+                    sched_ts[idx] = np.datetime64(start_time.rstrip("Z"))
+                    scheduled += 1
+                    logger.info("Pod %s scheduled at %s", pod_names[idx], start_time)
+            if scheduled == num_pods:
+                w.stop()
+                break
+    except Exception as e:
+        # Fall back to polling, but page through the LIST so a large
+        # cluster never materializes the full pod list at once.
+        print(f"Error watching pods: {e}; falling back to paginated polling")
+        end_time = time.time() + timeout
+        while scheduled < num_pods and time.time() < end_time:
+            for pod in _iter_pods(namespace, label_selector):
+                idx = name_to_idx.get(pod.metadata.name)
+                if idx is not None and np.isnat(sched_ts[idx]) and pod.status.start_time is not None:
+                    sched_ts[idx] = np.datetime64(pod.status.start_time.replace(tzinfo=None))
+                    scheduled += 1
+                    logger.info("Pod %s scheduled at %s", pod_names[idx], pod.status.start_time)
+            time.sleep(poll_interval)
+
+    _log_handler.flush()
 
-    if len(schedule_times) < num_pods:
-        print(f"Timeout reached. Only {len(schedule_times)} pods were scheduled out of {num_pods}.")
+    if scheduled < num_pods:
+        print(f"Timeout reached. Only {scheduled} pods were scheduled out of {num_pods}.")
 
+    # Hand dicts back at the boundary so the save/plot consumers are
+    # unchanged; NaT entries for unscheduled pods drop out as None.
+    sub_ts = sub_ns.astype("datetime64[ns]").astype("datetime64[us]")
+    submission_times = dict(zip(pod_names, sub_ts.tolist()))
+    schedule_times = {name: t for name, t in zip(pod_names, sched_ts.tolist())
+                      if t is not None}
     return submission_times, schedule_times
 
+def _latency_stats(sub_ts, sched_ts):
+    """Latency vector plus (avg, p50, p95, p99, makespan) in one compiled sweep"""
+    latencies = sched_ts - sub_ts
+    avg = latencies.mean()
+    sorted_lat = np.sort(latencies)
+    n = sorted_lat.shape[0]
+    p50 = sorted_lat[n // 2]
+    p95 = sorted_lat[min(int(0.95 * n), n - 1)]
+    p99 = sorted_lat[min(int(0.99 * n), n - 1)]
+    makespan = sched_ts.max() - sched_ts.min()
+    return latencies, avg, p50, p95, p99, makespan
+
+if HAS_NUMBA:
+    _latency_stats = numba.njit(cache=True, fastmath=True)(_latency_stats)
+
 def analyze_results(submission_times, schedule_times):
     """Compute scheduling latency (in seconds) for each pod and overall makespan."""
-    latencies = {}
-    for pod, sub_time in submission_times.items():
-        if pod in schedule_times:
-            sched_time = schedule_times[pod]
-            # Ensure both times are timezone-aware
-            if sub_time.tzinfo is None:
-                sub_time = sub_time.replace(tzinfo=datetime.timezone.utc)
-            if sched_time.tzinfo is None:
-                sched_time = sched_time.replace(tzinfo=datetime.timezone.utc)
-            
-            latency = (sched_time - sub_time).total_seconds()
-            latencies[pod] = latency
+    def _epoch(dt):
+        # Ensure the timestamp is timezone-aware before converting
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+        return dt.timestamp()
 
-    if not latencies:
+    pods = [pod for pod in submission_times if pod in schedule_times]
+    if not pods:
         raise ValueError("No pod scheduling events recorded!")
-    
-    # Makespan: time from first pod scheduled to last pod scheduled.
-    all_sched_times = list(schedule_times.values())
-    makespan = (max(all_sched_times) - min(all_sched_times)).total_seconds()
-    avg_latency = sum(latencies.values()) / len(latencies)
-    
-    # Calculate additional metrics
-    median_latency = np.median(list(latencies.values()))
-    p95_latency = np.percentile(list(latencies.values()), 95)
-    p99_latency = np.percentile(list(latencies.values()), 99)
-    
+
+    # Stack the timestamps into parallel float columns; the latency
+    # vector and all percentiles then come from single NumPy passes
+    # instead of repeated dict traversals and sorts.
+    sub_ts = np.fromiter((_epoch(submission_times[pod]) for pod in pods),
+                         dtype=np.float64, count=len(pods))
+    sched_ts = np.fromiter((_epoch(schedule_times[pod]) for pod in pods),
+                           dtype=np.float64, count=len(pods))
+    if HAS_NUMBA:
+        (latencies_arr, avg_latency, median_latency, p95_latency,
+         p99_latency, makespan) = _latency_stats(sub_ts, sched_ts)
+    else:
+        latencies_arr = sched_ts - sub_ts
+
+        # Makespan: time from first pod scheduled to last pod scheduled.
+        makespan = float(sched_ts.max() - sched_ts.min())
+        avg_latency = float(latencies_arr.mean())
+
+        # Calculate additional metrics: one sort serves all three quantiles
+        median_latency, p95_latency, p99_latency = np.percentile(latencies_arr, [50, 95, 99])
+
     metrics = {
-        "latencies": latencies,
+        "latencies": dict(zip(pods, latencies_arr.tolist())),
         "makespan": makespan,
         "avg_latency": avg_latency,
         "median_latency": median_latency,
         "p95_latency": p95_latency,
         "p99_latency": p99_latency,
-        "scheduled_count": len(latencies),
+        "scheduled_count": len(pods),
         "submission_count": len(submission_times)
     }
     
@@ -186,78 +349,71 @@ def analyze_results(submission_times, schedule_times):
 
 def plot_comparison(default_metrics, multi_metrics):
     """Plot comparison between default and preemptive schedulers."""
-    # Create DataFrames from latencies
-    default_df = pd.DataFrame(list(default_metrics["latencies"].items()), columns=["Pod", "Latency"])
-    default_df["Scheduler"] = "Default Scheduler"
-    
-    multi_df = pd.DataFrame(list(multi_metrics["latencies"].items()), columns=["Pod", "Latency"])
-    multi_df["Scheduler"] = "Preemptive Scheduler"
-    
-    # Combine data
-    combined_df = pd.concat([default_df, multi_df])
-    
+    plt = _pyplot()
+    # The latency vectors plot directly; no DataFrame/groupby detour.
+    default_lat = np.fromiter(default_metrics["latencies"].values(), dtype=np.float64)
+    multi_lat = np.fromiter(multi_metrics["latencies"].values(), dtype=np.float64)
+
+    # All three panels render into one figure: one backend setup, one
+    # layout pass and one PNG encode instead of three.
+    fig, (ax_hist, ax_box, ax_bar) = plt.subplots(1, 3, figsize=(24, 6))
+
     # 1. Histogram of scheduling latency
-    plt.figure(figsize=(12, 6))
-    plt.hist([default_df["Latency"], multi_df["Latency"]], bins=20, 
-             label=["Default Scheduler", "Preemptive Scheduler"],
-             alpha=0.7, edgecolor='black')
-    plt.xlabel("Scheduling Latency (seconds)")
-    plt.ylabel("Number of Pods")
-    plt.title("Scheduling Latency Distribution Comparison")
-    plt.legend()
-    plt.grid(True)
-    plt.savefig("latency_histogram_comparison.png")
-    plt.show()
-    
+    ax_hist.hist([default_lat, multi_lat], bins=20,
+                 label=["Default Scheduler", "Preemptive Scheduler"],
+                 alpha=0.7, edgecolor='black')
+    ax_hist.set_xlabel("Scheduling Latency (seconds)")
+    ax_hist.set_ylabel("Number of Pods")
+    ax_hist.set_title("Scheduling Latency Distribution Comparison")
+    ax_hist.legend()
+    ax_hist.grid(True)
+
     # 2. Box plot of latencies
-    plt.figure(figsize=(10, 6))
-    sns_plot = combined_df.boxplot(column="Latency", by="Scheduler", grid=True, figsize=(10, 6))
-    plt.title("Scheduling Latency Comparison")
-    plt.suptitle("")  # Remove default title
-    plt.ylabel("Latency (seconds)")
-    plt.savefig("latency_boxplot_comparison.png")
-    plt.show()
-    
+    ax_box.boxplot([default_lat, multi_lat], labels=["Default Scheduler", "Preemptive Scheduler"])
+    ax_box.set_title("Scheduling Latency Comparison")
+    ax_box.set_ylabel("Latency (seconds)")
+    ax_box.grid(True)
+
     # 3. Bar chart of key metrics
-    metrics = ["avg_latency", "median_latency", "p95_latency", "p99_latency", "makespan"]
-    default_values = [default_metrics[m] for m in metrics]
-    multi_values = [multi_metrics[m] for m in metrics]
-    
-    x = np.arange(len(metrics))
+    # One set of metric columns feeds both the bar chart and the summary
+    # table; the improvement column is computed branch-free.
+    metric_keys = ["avg_latency", "median_latency", "p95_latency", "p99_latency", "makespan"]
+    default_values = np.fromiter((default_metrics[k] for k in metric_keys), dtype=np.float64)
+    multi_values = np.fromiter((multi_metrics[k] for k in metric_keys), dtype=np.float64)
+    improvements = np.where(
+        default_values != 0,
+        (default_values - multi_values) / np.where(default_values != 0, default_values, 1.0) * 100,
+        0.0)
+
+    x = np.arange(len(metric_keys))
     width = 0.35
-    
-    fig, ax = plt.subplots(figsize=(12, 6))
-    ax.bar(x - width/2, default_values, width, label='Default Scheduler')
-    ax.bar(x + width/2, multi_values, width, label='Preemptive Scheduler')
-    
-    ax.set_ylabel('Seconds')
-    ax.set_title('Scheduler Performance Metrics Comparison')
-    ax.set_xticks(x)
-    ax.set_xticklabels(['Avg Latency', 'Median Latency', 'P95 Latency', 'P99 Latency', 'Makespan'])
-    ax.legend()
-    
+
+    ax_bar.bar(x - width/2, default_values, width, label='Default Scheduler')
+    ax_bar.bar(x + width/2, multi_values, width, label='Preemptive Scheduler')
+
+    ax_bar.set_ylabel('Seconds')
+    ax_bar.set_title('Scheduler Performance Metrics Comparison')
+    ax_bar.set_xticks(x)
+    ax_bar.set_xticklabels(['Avg Latency', 'Median Latency', 'P95 Latency', 'P99 Latency', 'Makespan'])
+    ax_bar.legend()
+
     # Add values on top of bars
     for i, v in enumerate(default_values):
-        ax.text(i - width/2, v + 0.1, f"{v:.2f}s", ha='center')
+        ax_bar.text(i - width/2, v + 0.1, f"{v:.2f}s", ha='center')
     for i, v in enumerate(multi_values):
-        ax.text(i + width/2, v + 0.1, f"{v:.2f}s", ha='center')
-    
-    plt.savefig("metrics_comparison.png")
-    plt.show()
-    
+        ax_bar.text(i + width/2, v + 0.1, f"{v:.2f}s", ha='center')
+
+    fig.tight_layout()
+    fig.savefig("comparison.png", dpi=100)
+    plt.close(fig)
+
     # Print summary
     print("\n===== PERFORMANCE COMPARISON =====")
     print(f"{'Metric':<20} {'Default Scheduler':<20} {'Preemptive Scheduler':<20} {'Improvement':<15}")
     print("-" * 75)
     
-    for metric in metrics:
-        default_val = default_metrics[metric]
-        multi_val = multi_metrics[metric]
-        if default_val == 0:
-            # Handle division by zero
-            improvement = 0 if multi_val == 0 else float('inf') if multi_val < 0 else float('-inf')
-        else:
-            improvement = ((default_val - multi_val) / default_val) * 100
+    for metric, default_val, multi_val, improvement in zip(
+            metric_keys, default_values, multi_values, improvements):
         print(f"{metric:<20} {default_val:<20.2f} {multi_val:<20.2f} {improvement:<15.2f}%")
     
     print(f"{'Scheduled Pods':<20} {default_metrics['scheduled_count']:<20} {multi_metrics['scheduled_count']:<20}")
@@ -268,17 +424,15 @@ def plot_comparison(default_metrics, multi_metrics):
     
     score_improvement = ((default_score - multi_score) / default_score) * 100
     print(f"{'Overall Score':<20} {default_score:<20.2f} {multi_score:<20.2f} {score_improvement:<15.2f}%")
-    
-    return combined_df
 
 def plot_single_results(metrics, scheduler_name):
     """Plot results for a single scheduler."""
-    # Create DataFrame from latencies
-    df = pd.DataFrame(list(metrics["latencies"].items()), columns=["Pod", "Latency"])
-    
+    plt = _pyplot()
+    latencies = np.fromiter(metrics["latencies"].values(), dtype=np.float64)
+
     # Histogram of scheduling latency
     plt.figure(figsize=(10, 5))
-    plt.hist(df["Latency"], bins=20, alpha=0.75, edgecolor='black')
+    plt.hist(latencies, bins=20, alpha=0.75, edgecolor='black')
     plt.xlabel("Scheduling Latency (seconds)")
     plt.ylabel("Number of Pods")
     plt.title(f"Scheduling Latency Distribution - {scheduler_name}")
@@ -314,33 +468,53 @@ def plot_single_results(metrics, scheduler_name):
     print(f"Overall makespan: {metrics['makespan']:.2f} seconds")
     print(f"Scheduled pods: {metrics['scheduled_count']} out of {metrics['submission_count']}")
 
-def cleanup_pods(namespace, label_selector="app=scheduler-test"):
+def cleanup_pods(namespace, label_selector="app=scheduler-test", wait_seconds=0):
     """Delete all test pods."""
     print(f"Cleaning up test pods with label: {label_selector}")
     try:
-        v1.delete_collection_namespaced_pod(namespace=namespace, label_selector=label_selector)
+        # Zero grace period + background propagation makes the apiserver
+        # return immediately; the kubelets reap the pods asynchronously.
+        v1.delete_collection_namespaced_pod(
+            namespace=namespace,
+            label_selector=label_selector,
+            grace_period_seconds=0,
+            propagation_policy="Background"
+        )
+        # Optionally wait briefly for the label to empty out when the
+        # caller is about to resubmit into the same capacity.
+        deadline = time.time() + wait_seconds
+        while time.time() < deadline:
+            if not v1.list_namespaced_pod(namespace=namespace, label_selector=label_selector).items:
+                break
+            time.sleep(0.5)
         print("Cleanup completed.")
     except Exception as e:
         print(f"Error during cleanup: {e}")
 
 def save_results(results, filename):
     """Save test results to a file."""
-    # Convert datetime objects to strings
-    for scheduler, metrics in results.items():
-        if "submission_times" in metrics:
-            metrics["submission_times"] = {pod: str(dt) for pod, dt in metrics["submission_times"].items()}
-        if "schedule_times" in metrics:
-            metrics["schedule_times"] = {pod: str(dt) for pod, dt in metrics["schedule_times"].items()}
-    
-    with open(filename, 'w') as f:
-        json.dump(results, f, indent=2)
+    if HAS_ORJSON:
+        # datetime values serialize directly; no str() conversion pass
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC))
+    else:
+        # Convert datetime objects to strings
+        for scheduler, metrics in results.items():
+            if "submission_times" in metrics:
+                metrics["submission_times"] = {pod: dt.isoformat() for pod, dt in metrics["submission_times"].items()}
+            if "schedule_times" in metrics:
+                metrics["schedule_times"] = {pod: dt.isoformat() for pod, dt in metrics["schedule_times"].items()}
+
+        with open(filename, 'w') as f:
+            json.dump(results, f, indent=2)
     print(f"Results saved to {filename}")
 
 def load_results(filename):
     """Load test results from a file."""
-    with open(filename, 'r') as f:
-        results = json.load(f)
-    
+    with open(filename, 'rb') as f:
+        data = f.read()
+    results = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
     # Convert string timestamps back to datetime objects
     for scheduler, metrics in results.items():
         if "submission_times" in metrics:
@@ -353,13 +527,6 @@ def load_results(filename):
     return results
 
 if __name__ == "__main__":
-    # Try to import seaborn for prettier plots
-    try:
-        import seaborn as sns
-        sns.set_theme(style="whitegrid")
-    except ImportError:
-        print("Seaborn not installed. Using matplotlib defaults.")
-    
     results = {}
     
     if args.load_results:
@@ -368,10 +535,12 @@ if __name__ == "__main__":
             results = load_results(args.output_file)
             print(f"Loaded results from {args.output_file}")
             
-            if "default" in results and "preemptive" in results:
+            if args.no_plot:
+                pass
+            elif "default" in results and "preemptive" in results:
                 plot_comparison(results["default"], results["preemptive"])
             elif args.scheduler in results:
-                plot_single_results(results[args.scheduler], 
+                plot_single_results(results[args.scheduler],
                                    "Default Scheduler" if args.scheduler == "default" else "Preemptive Scheduler")
             else:
                 print(f"No results found for scheduler: {args.scheduler}")
@@ -379,58 +548,57 @@ if __name__ == "__main__":
             print(f"Results file {args.output_file} not found.")
         exit(0)
     
-    # Clean up any existing test pods
-    cleanup_pods(args.namespace)
+    # Clean up any existing test pods before submitting new ones
+    cleanup_pods(args.namespace, wait_seconds=5)
     
     if args.compare:
-        # Run tests for both schedulers
-        
-        # 1. Default scheduler test
-        print("\n===== TESTING DEFAULT SCHEDULER =====")
-        default_submission_times, default_schedule_times = run_test(
-            num_pods=args.num_pods,
-            namespace=args.namespace,
-            image=args.image,
-            command=args.command,
-            poll_interval=args.poll_interval,
-            timeout=args.timeout,
-            scheduler_name=None,  # Use default scheduler
-            cpu_request=args.cpu_request,
-            memory_request=args.memory_request,
-            priority=args.priority
-        )
-        
+        # Run both scheduler tests concurrently: the two runs use
+        # distinct scheduler labels and pod name prefixes and are pure
+        # apiserver I/O on the client side, so they don't contend.
+        print("\n===== TESTING DEFAULT AND PREEMPTIVE SCHEDULERS =====")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            default_future = executor.submit(
+                run_test,
+                num_pods=args.num_pods,
+                namespace=args.namespace,
+                image=args.image,
+                command=args.command,
+                poll_interval=args.poll_interval,
+                timeout=args.timeout,
+                scheduler_name=None,  # Use default scheduler
+                cpu_request=args.cpu_request,
+                memory_request=args.memory_request,
+                priority=args.priority
+            )
+            multi_future = executor.submit(
+                run_test,
+                num_pods=args.num_pods,
+                namespace=args.namespace,
+                image=args.image,
+                command=args.command,
+                poll_interval=args.poll_interval,
+                timeout=args.timeout,
+                scheduler_name="preemptive-scheduler",  # Use the preemptive scheduler
+                cpu_request=args.cpu_request,
+                memory_request=args.memory_request,
+                priority=args.priority
+            )
+            default_submission_times, default_schedule_times = default_future.result()
+            multi_submission_times, multi_schedule_times = multi_future.result()
+
         default_metrics = analyze_results(default_submission_times, default_schedule_times)
         default_metrics["submission_times"] = default_submission_times
         default_metrics["schedule_times"] = default_schedule_times
         results["default"] = default_metrics
-        
-        # Clean up before next test
-        cleanup_pods(args.namespace, "app=scheduler-test,scheduler=default")
-        time.sleep(10)  # Wait for cleanup to complete
-        
-        # 2. Multi-resource scheduler test
-        print("\n===== TESTING PREEMPTIVE SCHEDULER =====")
-        multi_submission_times, multi_schedule_times = run_test(
-            num_pods=args.num_pods,
-            namespace=args.namespace,
-            image=args.image,
-            command=args.command,
-            poll_interval=args.poll_interval,
-            timeout=args.timeout,
-            scheduler_name="preemptive-scheduler",  # Use the preemptive scheduler
-            cpu_request=args.cpu_request,
-            memory_request=args.memory_request,
-            priority=args.priority
-        )
-        
+
         multi_metrics = analyze_results(multi_submission_times, multi_schedule_times)
         multi_metrics["submission_times"] = multi_submission_times
         multi_metrics["schedule_times"] = multi_schedule_times
         results["preemptive"] = multi_metrics
         
         # Plot comparison
-        plot_comparison(default_metrics, multi_metrics)
+        if not args.no_plot:
+            plot_comparison(default_metrics, multi_metrics)
         
     else:
         # Run test for single scheduler
@@ -457,7 +625,8 @@ if __name__ == "__main__":
         results[args.scheduler] = metrics
         
         # Plot single results
-        plot_single_results(metrics, display_name)
+        if not args.no_plot:
+            plot_single_results(metrics, display_name)
     
     # Save results
     save_results(results, args.output_file)
@@ -2,32 +2,64 @@
 import time
 import datetime
 import argparse
+import copy
 import json
-from kubernetes import client, config
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import Optional
+from kubernetes import client, config, watch
+from kubernetes.client.rest import ApiException
 import os
 
-# Configure command-line arguments.
-parser = argparse.ArgumentParser(description="Test the preemptive scheduler's ability to handle pod preemption.")
-parser.add_argument("--namespace", default="default", help="Kubernetes namespace to use")
-parser.add_argument("--poll-interval", type=int, default=2, help="Seconds between polling for pod status")
-parser.add_argument("--timeout", type=int, default=300, help="Overall timeout in seconds for the test")
-parser.add_argument("--output-file", default="preemption_test_results.json", help="File to save results to")
-args = parser.parse_args()
-
-# Load Kubernetes configuration.
 try:
-    config.load_kube_config()  # for local testing
-except:
-    config.load_incluster_config()  # when running inside cluster
-v1 = client.CoreV1Api()
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Populated by init_client(); kept as module globals so the helper
+# functions stay call-site compatible when imported from other tests.
+args = None
+v1 = None
+sched_v1 = None
+_known_pcs = set()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Test the preemptive scheduler's ability to handle pod preemption.")
+    parser.add_argument("--namespace", default="default", help="Kubernetes namespace to use")
+    parser.add_argument("--poll-interval", type=int, default=2, help="Seconds between polling for pod status")
+    parser.add_argument("--timeout", type=int, default=300, help="Overall timeout in seconds for the test")
+    parser.add_argument("--output-file", default="preemption_test_results.json", help="File to save results to")
+    return parser.parse_args()
+
+def init_client():
+    """Load kube config and build the shared API clients."""
+    global v1, sched_v1
+    if v1 is not None:
+        return
+    try:
+        config.load_kube_config()  # for local testing
+    except config.ConfigException:
+        config.load_incluster_config()  # when running inside cluster
+    # Share one ApiClient with a pool sized for the parallel submissions so
+    # TLS sessions are reused instead of renegotiated per call.
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = 32
+    api_client = client.ApiClient(configuration=configuration)
+    v1 = client.CoreV1Api(api_client=api_client)
+    sched_v1 = client.SchedulingV1Api(api_client=api_client)
 
 def create_priority_class(name, value, description):
     """Create a priority class if it doesn't exist."""
+    if name in _known_pcs:
+        return
     try:
         # Check if priority class exists
-        client.SchedulingV1Api().read_priority_class(name=name)
+        sched_v1.read_priority_class(name=name)
         print(f"Priority class {name} already exists")
-    except:
+    except ApiException as e:
+        if e.status != 404:
+            raise
         # Create priority class if it doesn't exist
         priority_class = client.V1PriorityClass(
             metadata=client.V1ObjectMeta(name=name),
@@ -35,92 +67,187 @@ def create_priority_class(name, value, description):
             global_default=False,
             description=description
         )
-        client.SchedulingV1Api().create_priority_class(body=priority_class)
-        print(f"Created priority class: {name} with value {value}")
+        try:
+            sched_v1.create_priority_class(body=priority_class)
+            print(f"Created priority class: {name} with value {value}")
+        except ApiException as e:
+            if e.status != 409:  # lost a create race; class exists
+                raise
+    _known_pcs.add(name)
 
 def setup_priority_classes():
     """Set up the priority classes needed for the test."""
     create_priority_class("low-priority", 10, "Low priority pods")
     create_priority_class("high-priority", 100, "High priority pods")
 
-def submit_pod(pod_name, namespace, image, command, scheduler_name=None, 
+# Plain-dict manifest shared by every pod; copying and patching it avoids
+# rebuilding and validating the V1Pod object tree per submission.
+_POD_TEMPLATE = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "name": None,
+        "labels": {}
+    },
+    "spec": {
+        "schedulerName": None,
+        "restartPolicy": "Never",
+        "priorityClassName": None,
+        "tolerations": [
+            {
+                "key": "node-role.kubernetes.io/master",
+                "operator": "Equal",
+                "value": "true",
+                "effect": "NoSchedule"
+            }
+        ],
+        "containers": [
+            {
+                "name": "container",
+                "image": None,
+                "command": None,
+                "resources": {
+                    "requests": {},
+                    "limits": {}
+                }
+            }
+        ]
+    }
+}
+
+def submit_pod(pod_name, namespace, image, command, scheduler_name=None,
                cpu_request="100m", memory_request="128Mi", priority_class=None,
                labels=None):
     """Create a pod with the given specifications."""
-    
-    # Create pod manifest
-    pod_manifest = client.V1Pod(
-        metadata=client.V1ObjectMeta(
-            name=pod_name,
-            labels=labels or {}
-        ),
-        spec=client.V1PodSpec(
-            scheduler_name=scheduler_name,  # Use specified scheduler or default if None
-            restart_policy="Never",
-            priority_class_name=priority_class,
-            tolerations=[
-                client.V1Toleration(
-                    key="node-role.kubernetes.io/master",
-                    operator="Equal",
-                    value="true",
-                    effect="NoSchedule"
-                )
-            ],
-            containers=[
-                client.V1Container(
-                    name="container",
-                    image=image,
-                    command=command,
-                    resources=client.V1ResourceRequirements(
-                        requests={"cpu": cpu_request, "memory": memory_request},
-                        limits={"cpu": cpu_request, "memory": memory_request}
-                    )
-                )
-            ]
-        )
-    )
-    try:
-        v1.create_namespaced_pod(namespace=namespace, body=pod_manifest)
-        print(f"Created pod: {pod_name}")
-        return True
-    except Exception as e:
-        print(f"Error creating pod {pod_name}: {e}")
-        return False
 
-def get_pod_status(pod_name, namespace):
-    """Get the current status of a pod."""
+    body = copy.deepcopy(_POD_TEMPLATE)
+    body["metadata"]["name"] = pod_name
+    body["metadata"]["labels"] = labels or {}
+    body["spec"]["schedulerName"] = scheduler_name  # Use specified scheduler or default if None
+    body["spec"]["priorityClassName"] = priority_class
+    container = body["spec"]["containers"][0]
+    container["image"] = image
+    container["command"] = command
+    requests = {"cpu": cpu_request, "memory": memory_request}
+    container["resources"]["requests"] = requests
+    container["resources"]["limits"] = dict(requests)
+    for attempt in range(2):
+        try:
+            v1.api_client.call_api(
+                '/api/v1/namespaces/{namespace}/pods', 'POST',
+                path_params={'namespace': namespace},
+                header_params={'Content-Type': 'application/json',
+                               'Accept': 'application/json'},
+                body=body,
+                auth_settings=['BearerToken'],
+                response_type='object',
+                _return_http_data_only=True
+            )
+            print(f"Created pod: {pod_name}")
+            return True
+        except ApiException as e:
+            if e.status == 409:  # already exists; creation is idempotent here
+                print(f"Pod {pod_name} already exists")
+                return True
+            if e.status == 429 and attempt == 0:
+                # Honor the server's rate-limit hint and retry once.
+                time.sleep(int(e.headers.get("Retry-After", "1")))
+                continue
+            print(f"Error creating pod {pod_name}: {e}")
+            return False
+    return False
+
+@dataclass(frozen=True, slots=True)
+class PodStatus:
+    """Snapshot of a pod observed by the test."""
+    name: str
+    phase: str
+    start_time: Optional[str]
+    node_name: Optional[str]
+
+def list_pods_by_label(namespace, selector):
+    """List pods matching a label selector, keyed by name."""
+    # resource_version="0" serves the list from the apiserver watch cache
+    # instead of going to etcd.
+    pod_list = v1.list_namespaced_pod(namespace, label_selector=selector,
+                                      resource_version="0")
+    return {p.metadata.name: p for p in pod_list.items}
+
+def wait_for_pods_running(pod_names, namespace, timeout):
+    """Wait for all named pods to reach Running over one watch stream."""
+    pending = set(pod_names)
+    statuses = []
+    if not pending:
+        # Nothing to wait for (every submission failed); don't sit on the
+        # watch until timeout_seconds expires.
+        return statuses
+    print(f"Waiting for {len(pending)} pods to reach status: Running")
+    # A single watch pushes every transition as it happens, replacing one
+    # read_namespaced_pod poll loop per pod.
+    w = watch.Watch()
     try:
-        pod = v1.read_namespaced_pod(name=pod_name, namespace=namespace)
-        return {
-            "name": pod_name,
-            "phase": pod.status.phase,
-            "start_time": pod.status.start_time,
-            "node_name": pod.spec.node_name if pod.spec.node_name else None
-        }
+        for event in w.stream(v1.list_namespaced_pod,
+                              namespace=namespace,
+                              label_selector="app=preemption-test",
+                              field_selector="status.phase=Running",
+                              timeout_seconds=timeout):
+            pod = event["object"]
+            name = pod.metadata.name
+            if name in pending and pod.status.phase == "Running":
+                pending.discard(name)
+                status = PodStatus(
+                    name=name,
+                    phase=pod.status.phase,
+                    start_time=pod.status.start_time.isoformat() if pod.status.start_time else None,
+                    node_name=pod.spec.node_name if pod.spec.node_name else None
+                )
+                statuses.append(status)
+                print(f"Pod {name} reached status Running on node {status.node_name}")
+                if not pending:
+                    w.stop()
+                    break
     except Exception as e:
-        print(f"Error reading pod {pod_name}: {e}")
-        return None
-
-def wait_for_pod_status(pod_name, namespace, desired_status, timeout):
-    """Wait for a pod to reach the desired status."""
-    print(f"Waiting for pod {pod_name} to reach status: {desired_status}")
-    end_time = time.time() + timeout
-    while time.time() < end_time:
-        status = get_pod_status(pod_name, namespace)
-        if status and status["phase"] == desired_status:
-            print(f"Pod {pod_name} reached status {desired_status} on node {status['node_name']}")
-            return status
-        time.sleep(args.poll_interval)
-    print(f"Timeout waiting for pod {pod_name} to reach status {desired_status}")
-    return None
+        print(f"Error watching pods: {e}")
+
+    if pending:
+        print(f"Timeout waiting for pods to reach status Running: {sorted(pending)}")
+    return statuses
+
+def backoff_sleeps(initial=0.5, cap=8.0):
+    """Yield sleep durations that double up to a cap."""
+    delay = initial
+    while True:
+        yield delay
+        delay = min(cap, delay * 2)
 
 def cleanup_pods(namespace, label_selector="app=preemption-test"):
     """Delete all test pods."""
     print(f"Cleaning up test pods with label: {label_selector}")
     try:
         v1.delete_collection_namespaced_pod(namespace=namespace, label_selector=label_selector)
-        # Wait for pods to be deleted
-        time.sleep(10)
+        # Watch DELETED events until every remaining pod drains instead of
+        # sampling the list on a timer.
+        current = set(list_pods_by_label(namespace, label_selector))
+        if current:
+            try:
+                w = watch.Watch()
+                for event in w.stream(v1.list_namespaced_pod,
+                                      namespace=namespace,
+                                      label_selector=label_selector,
+                                      timeout_seconds=60):
+                    if event["type"] == "DELETED":
+                        current.discard(event["object"].metadata.name)
+                        if not current:
+                            w.stop()
+                            break
+            except Exception as e:
+                # Fall back to backoff polling if the watch drops.
+                print(f"Error watching pod deletions: {e}")
+                deadline = time.time() + 60
+                for delay in backoff_sleeps():
+                    if not list_pods_by_label(namespace, label_selector) or time.time() >= deadline:
+                        break
+                    time.sleep(delay)
         print("Cleanup completed.")
     except Exception as e:
         print(f"Error during cleanup: {e}")
@@ -142,77 +269,75 @@ def run_preemption_test():
         
         # Step 1: Create low priority pods that consume most of the resources
         print("\n===== STEP 1: Creating low priority pods =====")
+        # Pod creation is API-bound, so submit the batch concurrently.
         low_priority_pods = []
-        for i in range(10):  # Create 10 low priority pods
-            pod_name = f"low-priority-pod-{i}"
-            labels = {"app": "preemption-test", "priority": "low"}
-            
-            success = submit_pod(
-                pod_name=pod_name,
-                namespace=args.namespace,
-                image="polinux/stress",
-                command=["stress", "--cpu", "1", "--vm", "1", "--vm-bytes", "256M", "--timeout", "300"],
-                scheduler_name="preemptive-scheduler",
-                cpu_request="500m",
-                memory_request="512Mi",
-                priority_class="low-priority",
-                labels=labels
-            )
-            
-            if success:
-                low_priority_pods.append(pod_name)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {
+                executor.submit(
+                    submit_pod,
+                    pod_name=f"low-priority-pod-{i}",
+                    namespace=args.namespace,
+                    image="polinux/stress",
+                    command=["stress", "--cpu", "1", "--vm", "1", "--vm-bytes", "256M", "--timeout", "300"],
+                    scheduler_name="preemptive-scheduler",
+                    cpu_request="500m",
+                    memory_request="512Mi",
+                    priority_class="low-priority",
+                    labels={"app": "preemption-test", "priority": "low"}
+                ): f"low-priority-pod-{i}"
+                for i in range(10)  # Create 10 low priority pods
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    low_priority_pods.append(futures[future])
         
         # Wait for low priority pods to start running
         print("\nWaiting for low priority pods to start running...")
-        low_pod_statuses = []
-        for pod_name in low_priority_pods:
-            status = wait_for_pod_status(pod_name, args.namespace, "Running", 60)
-            if status:
-                low_pod_statuses.append(status)
-        
+        low_pod_statuses = wait_for_pods_running(low_priority_pods, args.namespace, 60)
+
         print(f"\n{len(low_pod_statuses)} out of {len(low_priority_pods)} low priority pods are running")
         results["low_priority_pods"] = low_pod_statuses
         
         # Step 2: Create high priority pods that should trigger preemption
         print("\n===== STEP 2: Creating high priority pods =====")
         high_priority_pods = []
-        for i in range(5):  # Create 5 high priority pods
-            pod_name = f"high-priority-pod-{i}"
-            labels = {"app": "preemption-test", "priority": "high"}
-            
-            success = submit_pod(
-                pod_name=pod_name,
-                namespace=args.namespace,
-                image="polinux/stress",
-                command=["stress", "--cpu", "1", "--vm", "1", "--vm-bytes", "256M", "--timeout", "300"],
-                scheduler_name="preemptive-scheduler",
-                cpu_request="1000m",  # Higher resource request to force preemption
-                memory_request="1Gi",
-                priority_class="high-priority",
-                labels=labels
-            )
-            
-            if success:
-                high_priority_pods.append(pod_name)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {
+                executor.submit(
+                    submit_pod,
+                    pod_name=f"high-priority-pod-{i}",
+                    namespace=args.namespace,
+                    image="polinux/stress",
+                    command=["stress", "--cpu", "1", "--vm", "1", "--vm-bytes", "256M", "--timeout", "300"],
+                    scheduler_name="preemptive-scheduler",
+                    cpu_request="1000m",  # Higher resource request to force preemption
+                    memory_request="1Gi",
+                    priority_class="high-priority",
+                    labels={"app": "preemption-test", "priority": "high"}
+                ): f"high-priority-pod-{i}"
+                for i in range(5)  # Create 5 high priority pods
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    high_priority_pods.append(futures[future])
         
         # Wait for high priority pods to start running
         print("\nWaiting for high priority pods to start running...")
-        high_pod_statuses = []
-        for pod_name in high_priority_pods:
-            status = wait_for_pod_status(pod_name, args.namespace, "Running", 120)
-            if status:
-                high_pod_statuses.append(status)
-        
+        high_pod_statuses = wait_for_pods_running(high_priority_pods, args.namespace, 120)
+
         print(f"\n{len(high_pod_statuses)} out of {len(high_priority_pods)} high priority pods are running")
         results["high_priority_pods"] = high_pod_statuses
         
         # Step 3: Check if any low priority pods were preempted
         print("\n===== STEP 3: Checking for preempted low priority pods =====")
+        # One LIST covers every low priority pod instead of a GET per pod.
+        low_pods = list_pods_by_label(args.namespace, "app=preemption-test,priority=low")
         preempted_pods = []
         for pod_name in low_priority_pods:
-            status = get_pod_status(pod_name, args.namespace)
-            if status and status["phase"] != "Running":
-                print(f"Pod {pod_name} was preempted, current status: {status['phase']}")
+            pod = low_pods.get(pod_name)
+            phase = pod.status.phase if pod else "Deleted"
+            if phase != "Running":
+                print(f"Pod {pod_name} was preempted, current status: {phase}")
                 preempted_pods.append(pod_name)
         
         results["preempted_pods"] = preempted_pods
@@ -224,16 +349,17 @@ def run_preemption_test():
         else:
             print("PREEMPTION TEST FAILED: No low priority pods were preempted")
         
-        # Save results
-        with open(args.output_file, 'w') as f:
-            # Convert datetime objects to strings for JSON serialization
-            for pod_list in [results["low_priority_pods"], results["high_priority_pods"]]:
-                for pod in pod_list:
-                    if pod and "start_time" in pod and pod["start_time"]:
-                        pod["start_time"] = pod["start_time"].isoformat()
-            
-            json.dump(results, f, indent=2)
-            print(f"Results saved to {args.output_file}")
+        # Save results; timestamps are already isoformat strings and each
+        # PodStatus becomes a dict only once, here.
+        for key in ("low_priority_pods", "high_priority_pods"):
+            results[key] = [asdict(ps) for ps in results[key]]
+        if HAS_ORJSON:
+            with open(args.output_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(args.output_file, 'w') as f:
+                json.dump(results, f, separators=(",", ":"), default=str)
+        print(f"Results saved to {args.output_file}")
         
         return results
     
@@ -241,5 +367,11 @@ def run_preemption_test():
         # Clean up
         cleanup_pods(args.namespace)
 
+def main():
+    global args
+    args = parse_args()
+    init_client()
+    run_preemption_test()
+
 if __name__ == "__main__":
-    run_preemption_test() 
\ No newline at end of file
+    main()
\ No newline at end of file